@@ -2,8 +2,8 @@
 CRUD operations for database models
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
-from typing import List, Optional
+from sqlalchemy import desc, and_, insert, tuple_
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from api.models import (
@@ -28,25 +28,26 @@ def save_market_data_batch(db: Session, data_list: list) -> int:
             db.query(MarketData).filter(MarketData.symbol == symbol).delete()
             db.commit()
         
-        # Insertar nuevos registros
-        records = []
-        for data in data_list:
-            record = MarketData(
-                symbol=data['symbol'],
-                asset_type=data.get('asset_type', 'crypto'),
-                timestamp=data['timestamp'],
-                timeframe=data.get('timeframe', '1d'),
-                open=float(data['open']),
-                high=float(data['high']),
-                low=float(data['low']),
-                close=float(data['close']),
-                volume=float(data['volume'])
-            )
-            records.append(record)
+        # Insertar nuevos registros (un solo executemany, sin objetos ORM)
+        rows = [
+            {
+                'symbol': data['symbol'],
+                'asset_type': data.get('asset_type', 'crypto'),
+                'timestamp': data['timestamp'],
+                'timeframe': data.get('timeframe', '1d'),
+                'open': float(data['open']),
+                'high': float(data['high']),
+                'low': float(data['low']),
+                'close': float(data['close']),
+                'volume': float(data['volume'])
+            }
+            for data in data_list
+        ]
         
-        db.bulk_save_objects(records)
+        if rows:
+            db.execute(insert(MarketData), rows)
         db.commit()
-        return len(records)
+        return len(rows)
     except Exception as e:
         db.rollback()
         raise
@@ -303,9 +304,16 @@ def get_backtests(
     strategy_id: int = None,
     symbol: str = None,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[Tuple[datetime, int]] = None
 ) -> List[Backtest]:
-    """Get backtests with optional filters"""
+    """
+    Get backtests with optional filters, newest first.
+    
+    If cursor (executed_at, id) of the last row seen is given, uses keyset
+    pagination (WHERE (executed_at, id) < cursor) and ignores offset, so
+    deep pages don't make the database scan and discard skipped rows.
+    """
     query = db.query(Backtest)
     
     if strategy_id:
@@ -313,7 +321,12 @@ def get_backtests(
     if symbol:
         query = query.filter(Backtest.symbol == symbol)
     
-    return query.order_by(desc(Backtest.executed_at)).limit(limit).offset(offset).all()
+    if cursor is not None:
+        query = query.filter(tuple_(Backtest.executed_at, Backtest.id) < cursor)
+        offset = 0
+    
+    query = query.order_by(desc(Backtest.executed_at), desc(Backtest.id))
+    return query.limit(limit).offset(offset).all()
 
 
 def get_best_backtest(
@@ -394,18 +407,20 @@ def bulk_create_trades(db: Session, backtest_id: int, trades_data: List[dict]):
             return value.to_pydatetime() if hasattr(value, 'to_pydatetime') else value
         return value
     
-    trades = []
-    for trade_data in trades_data:
-        trade = Trade(
-            backtest_id=backtest_id,
-            trade_type=trade_data.get('type', 'BUY'),
-            entry_date=to_native_type(trade_data.get('date')),
-            entry_price=to_native_type(trade_data.get('price')),
-            shares=to_native_type(trade_data.get('shares'))
-        )
-        trades.append(trade)
+    rows = [
+        {
+            'backtest_id': backtest_id,
+            'trade_type': trade_data.get('type', 'BUY'),
+            'entry_date': to_native_type(trade_data.get('date')),
+            'entry_price': to_native_type(trade_data.get('price')),
+            'shares': to_native_type(trade_data.get('shares'))
+        }
+        for trade_data in trades_data
+    ]
     
-    db.bulk_save_objects(trades)
+    # Un solo executemany en vez de construir objetos ORM por trade
+    if rows:
+        db.execute(insert(Trade), rows)
     db.commit()
 
 
@@ -419,18 +434,20 @@ def bulk_create_equity_points(
     equity_data: List[dict]
 ):
     """Bulk create equity curve points"""
-    points = []
-    for data in equity_data:
-        point = EquityPoint(
-            backtest_id=backtest_id,
-            timestamp=data.get('timestamp'),
-            equity=data.get('equity'),
-            position_value=data.get('position_value', 0),
-            cash=data.get('cash')
-        )
-        points.append(point)
+    rows = [
+        {
+            'backtest_id': backtest_id,
+            'timestamp': data.get('timestamp'),
+            'equity': data.get('equity'),
+            'position_value': data.get('position_value', 0),
+            'cash': data.get('cash')
+        }
+        for data in equity_data
+    ]
     
-    db.bulk_save_objects(points)
+    # Un solo executemany en vez de construir objetos ORM por punto
+    if rows:
+        db.execute(insert(EquityPoint), rows)
     db.commit()
 
 
@@ -495,6 +512,48 @@ def get_market_data(
     return query.order_by(MarketData.timestamp).all()
 
 
+def get_close_prices(
+    db: Session,
+    symbol: str,
+    timeframe: str = "1d",
+    start_date: datetime = None,
+    end_date: datetime = None,
+    with_date_str: bool = True
+) -> list:
+    """
+    Get (timestamp, date_str, close) rows without hydrating ORM objects.
+    
+    The 'YYYY-MM-DD' date string is formatted by the database so callers
+    don't need a per-row datetime -> string conversion in Python. With
+    with_date_str=False the rows are just (timestamp, close).
+    """
+    from sqlalchemy import func
+    
+    columns = [MarketData.timestamp]
+    if with_date_str:
+        if db.get_bind().dialect.name == 'postgresql':
+            date_str = func.to_char(MarketData.timestamp, 'YYYY-MM-DD')
+        else:
+            # SQLite (dev/tests)
+            date_str = func.strftime('%Y-%m-%d', MarketData.timestamp)
+        columns.append(date_str.label('date_str'))
+    columns.append(MarketData.close)
+    
+    query = db.query(*columns).filter(
+        and_(
+            MarketData.symbol == symbol,
+            MarketData.timeframe == timeframe
+        )
+    )
+    
+    if start_date:
+        query = query.filter(MarketData.timestamp >= start_date)
+    if end_date:
+        query = query.filter(MarketData.timestamp <= end_date)
+    
+    return query.order_by(MarketData.timestamp).all()
+
+
 # ============================================================================
 # STATISTICS
 # ============================================================================
@@ -2,7 +2,7 @@
 CRUD operations for broker management
 """
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, undefer_group
 from sqlalchemy import and_
 from datetime import datetime
 import logging
@@ -126,6 +126,43 @@ def update_broker_config(
 
 # ==================== BROKER CREDENTIALS ====================
 
+def _has_secret(column):
+    """Equivalente SQL de bool(column): ni NULL ni cadena vacía"""
+    return and_(column.is_not(None), column != '')
+
+
+def _credential_response_query(db: Session, user_id: int):
+    """
+    Query de credenciales con solo columnas no sensibles
+    
+    Los has_* se calculan en SQL para no traer los blobs encriptados
+    (columnas deferred del grupo 'secrets') al servidor de aplicación.
+    """
+    cred_model = models.BrokerCredential
+    config_model = models.BrokerConfig
+    
+    return db.query(
+        cred_model.id,
+        cred_model.user_id,
+        cred_model.broker_config_id,
+        config_model.broker_name,
+        config_model.display_name.label('broker_display_name'),
+        config_model.broker_type,
+        cred_model.is_active,
+        cred_model.is_testnet,
+        cred_model.validation_status,
+        cred_model.last_validated_at,
+        cred_model.last_validation_error.label('validation_error'),
+        cred_model.created_at,
+        cred_model.updated_at,
+        _has_secret(cred_model.api_key_encrypted).label('has_api_key'),
+        _has_secret(cred_model.api_secret_encrypted).label('has_api_secret'),
+        _has_secret(cred_model.api_passphrase_encrypted).label('has_api_passphrase'),
+    ).join(
+        config_model, cred_model.broker_config_id == config_model.id
+    ).filter(cred_model.user_id == user_id)
+
+
 def get_broker_credentials(
     db: Session,
     user_id: int = 1,
@@ -144,43 +181,45 @@ def get_broker_credentials(
     Returns:
         Lista de credenciales (sin secrets)
     """
-    query = db.query(models.BrokerCredential).options(
-        joinedload(models.BrokerCredential.broker_config)
-    ).filter(models.BrokerCredential.user_id == user_id)
+    query = _credential_response_query(db, user_id)
     
     if broker_type:
-        query = query.join(models.BrokerConfig).filter(
-            models.BrokerConfig.broker_type == broker_type
-        )
+        query = query.filter(models.BrokerConfig.broker_type == broker_type)
     
     if is_active is not None:
         query = query.filter(models.BrokerCredential.is_active == is_active)
     
-    credentials = query.all()
-    
     # Transformar a schema sin exponer secrets
-    result = []
-    for cred in credentials:
-        result.append(models.BrokerCredentialResponse(
-            id=cred.id,
-            user_id=cred.user_id,
-            broker_config_id=cred.broker_config_id,
-            broker_name=cred.broker_config.broker_name,
-            broker_display_name=cred.broker_config.display_name,
-            broker_type=cred.broker_config.broker_type,
-            is_active=cred.is_active,
-            is_testnet=cred.is_testnet,
-            validation_status=cred.validation_status,
-            last_validated_at=cred.last_validated_at,
-            validation_error=cred.validation_error,
-            created_at=cred.created_at,
-            updated_at=cred.updated_at,
-            has_api_key=bool(cred.api_key_encrypted),
-            has_api_secret=bool(cred.api_secret_encrypted),
-            has_api_passphrase=bool(cred.api_passphrase_encrypted),
-        ))
-    
-    return result
+    return [
+        models.BrokerCredentialResponse(**row._asdict())
+        for row in query.all()
+    ]
+
+
+def get_broker_credential_response(
+    db: Session,
+    credential_id: int,
+    user_id: int = 1
+) -> Optional[models.BrokerCredentialResponse]:
+    """
+    Obtiene una credencial como response (sin exponer secrets)
+    
+    Misma query que get_broker_credentials: no carga los blobs encriptados
+    para calcular los has_*.
+    
+    Args:
+        db: Database session
+        credential_id: ID de la credencial
+        user_id: ID del usuario (para validar ownership)
+        
+    Returns:
+        BrokerCredentialResponse o None
+    """
+    row = _credential_response_query(db, user_id).filter(
+        models.BrokerCredential.id == credential_id
+    ).first()
+    
+    return models.BrokerCredentialResponse(**row._asdict()) if row else None
 
 
 def get_broker_credential(
@@ -201,8 +240,12 @@ def get_broker_credential(
     Returns:
         BrokerCredential o None
     """
+    options = [joinedload(models.BrokerCredential.broker_config)]
+    if decrypt:
+        options.append(undefer_group('secrets'))
+    
     cred = db.query(models.BrokerCredential).options(
-        joinedload(models.BrokerCredential.broker_config)
+        *options
     ).filter(
         and_(
             models.BrokerCredential.id == credential_id,
@@ -0,0 +1,16 @@
+"""
+Shared FastAPI dependencies
+"""
+from fastapi import Request
+
+from utils.data_fetcher import DataFetcher
+
+
+def get_data_fetcher(request: Request) -> DataFetcher:
+    """
+    DataFetcher dependency for FastAPI
+
+    Returns the single instance created in the app lifespan, so all
+    routers share one exchange client and its HTTP connection pool.
+    """
+    return request.app.state.data_fetcher
@@ -2,6 +2,9 @@
 FastAPI Application - Clean Architecture
 Main entry point following SOLID principles
 """
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -9,6 +12,24 @@ from api.database import Base, engine
 from api.services import register_default_strategies
 from api.routers import brokers, strategies as strategy_router
 from api.routers import pair_data, backtests, market_data
+from utils.data_fetcher import DataFetcher
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown: one shared DataFetcher for every router"""
+    app.state.data_fetcher = DataFetcher()
+    print("🚀 Trading API started")
+    print("📊 Dashboard: http://localhost:8000")
+    print("📖 Docs: http://localhost:8000/docs")
+    yield
+    app.state.data_fetcher.close()
+    print("👋 Trading API shutting down")
 
 
 def create_app() -> FastAPI:
@@ -23,7 +44,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="Algorithmic Trading Dashboard",
         description="API for backtesting trading strategies",
-        version="2.0.0"
+        version="2.0.0",
+        lifespan=lifespan
     )
     
     # Configure CORS
@@ -52,20 +74,6 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize on startup"""
-    print("🚀 Trading API started")
-    print("📊 Dashboard: http://localhost:8000")
-    print("📖 Docs: http://localhost:8000/docs")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    print("👋 Trading API shutting down")
-
-
 @app.get("/")
 async def root():
     """Health check endpoint"""
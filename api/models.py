@@ -2,9 +2,9 @@
 SQLAlchemy models for PostgreSQL and Pydantic schemas for API
 """
 from sqlalchemy import Column, Integer, String, Float, DateTime, JSON, ForeignKey, Boolean, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -86,10 +86,10 @@ class BrokerCredential(Base):
     user_id = Column(Integer, default=1, index=True)  # Para multi-usuario futuro
     broker_config_id = Column(Integer, ForeignKey("broker_configs.id"), nullable=False)
     
-    # Credenciales encriptadas
-    api_key_encrypted = Column(Text, nullable=False)
-    api_secret_encrypted = Column(Text)
-    api_passphrase_encrypted = Column(Text)
+    # Credenciales encriptadas (diferidas: solo se cargan al desencriptar)
+    api_key_encrypted = deferred(Column(Text, nullable=False), group='secrets')
+    api_secret_encrypted = deferred(Column(Text), group='secrets')
+    api_passphrase_encrypted = deferred(Column(Text), group='secrets')
     
     # Configuración
     is_active = Column(Boolean, default=True)
@@ -105,6 +105,12 @@ class BrokerCredential(Base):
     
     # Relationships
     broker_config = relationship("BrokerConfig", back_populates="credentials")
+    
+    # Valores desencriptados en memoria (no persistidos); los completa
+    # crud_brokers.get_broker_credential(..., decrypt=True)
+    api_key_decrypted = None
+    api_secret_decrypted = None
+    api_passphrase_decrypted = None
 
 
 class AssetType(str, Enum):
@@ -276,11 +282,13 @@ class BacktestRequest(BaseModel):
     params: Optional[Dict[str, Any]] = Field(default=None, description="Strategy parameters")
     use_real_data: bool = Field(default=True, description="Use real market data vs synthetic")
     
-    def __init__(self, **data):
+    @model_validator(mode="before")
+    @classmethod
+    def _alias_strategy_type(cls, data: Any) -> Any:
         # Allow strategy_type as alias for strategy_id
-        if 'strategy_type' in data and 'strategy_id' not in data:
-            data['strategy_id'] = data['strategy_type']
-        super().__init__(**data)
+        if isinstance(data, dict) and 'strategy_type' in data and 'strategy_id' not in data:
+            data = {**data, 'strategy_id': data['strategy_type']}
+        return data
 
 
 class BacktestResponse(BaseModel):
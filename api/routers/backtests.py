@@ -1,9 +1,12 @@
 """
 Backtest Router - Handles backtest history
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
 from typing import List, Optional
+from datetime import datetime
+import base64
 
 from api.database import get_db
 from api import crud
@@ -11,22 +14,55 @@ from api.models import BacktestResult, BacktestDetailResult
 
 router = APIRouter(prefix="/api", tags=["backtests"])
 
+# Serializer compilado una sola vez; la lista se vuelca a JSON directamente
+# con pydantic-core en vez de pasar por el response_model de FastAPI
+_BACKTEST_LIST_ADAPTER = TypeAdapter(List[BacktestResult])
+
+
+def _encode_cursor(executed_at: datetime, backtest_id: int) -> str:
+    """
+    Build the keyset cursor for the row after (executed_at, id)
+    
+    'executed_at|id' is urlsafe-base64 encoded (without padding) so the
+    '+' of the UTC offset survives being sent back unencoded in the URL.
+    """
+    raw = f"{executed_at.isoformat()}|{backtest_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+
+def _parse_cursor(cursor: str):
+    """Parse a keyset cursor built by _encode_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        executed_at, backtest_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(executed_at), int(backtest_id)
+    except ValueError:
+        # binascii.Error y UnicodeDecodeError también son ValueError
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 @router.get("/backtests", response_model=List[BacktestResult])
 async def list_backtests(
     strategy_id: Optional[int] = None,
     symbol: Optional[str] = None,
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get backtest history"""
+    """
+    Get backtest history
+    
+    For deep pagination pass the X-Next-Cursor header of the previous page
+    as `cursor` instead of increasing `offset`.
+    """
     backtests = crud.get_backtests(
         db=db,
         strategy_id=strategy_id,
         symbol=symbol,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=_parse_cursor(cursor) if cursor else None
     )
     
     results = []
@@ -50,7 +86,16 @@ async def list_backtests(
             status=bt.status
         ))
     
-    return results
+    response = Response(
+        content=_BACKTEST_LIST_ADAPTER.dump_json(results),
+        media_type="application/json"
+    )
+    # executed_at lo pone la base (server_default); sin él no hay cursor
+    last = backtests[-1] if backtests else None
+    if len(backtests) == limit and last.executed_at is not None:
+        response.headers['X-Next-Cursor'] = _encode_cursor(last.executed_at, last.id)
+    
+    return response
 
 
 @router.get("/backtests/{backtest_id}", response_model=BacktestDetailResult)
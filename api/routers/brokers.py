@@ -156,8 +156,8 @@ async def get_broker_credential(
     """
     user_id = 1  # TODO: Obtener del token
     
-    credential = crud_brokers.get_broker_credential(
-        db, credential_id=credential_id, user_id=user_id, decrypt=False
+    credential = crud_brokers.get_broker_credential_response(
+        db, credential_id=credential_id, user_id=user_id
     )
     
     if not credential:
@@ -166,25 +166,7 @@ async def get_broker_credential(
             detail=f"Credential {credential_id} not found"
         )
     
-    # Transformar a response model
-    return models.BrokerCredentialResponse(
-        id=credential.id,
-        user_id=credential.user_id,
-        broker_config_id=credential.broker_config_id,
-        broker_name=credential.broker_config.broker_name,
-        broker_display_name=credential.broker_config.display_name,
-        broker_type=credential.broker_config.broker_type,
-        is_active=credential.is_active,
-        is_testnet=credential.is_testnet,
-        validation_status=credential.validation_status,
-        last_validated_at=credential.last_validated_at,
-        validation_error=credential.validation_error,
-        created_at=credential.created_at,
-        updated_at=credential.updated_at,
-        has_api_key=bool(credential.api_key_encrypted),
-        has_api_secret=bool(credential.api_secret_encrypted),
-        has_api_passphrase=bool(credential.api_passphrase_encrypted),
-    )
+    return credential
 
 
 @router.post("/credentials", response_model=models.BrokerCredentialResponse, status_code=status.HTTP_201_CREATED)
@@ -206,24 +188,9 @@ async def create_broker_credential(
         
         db_credential = crud_brokers.create_broker_credential(db, credential, user_id)
         
-        # Transformar a response
-        return models.BrokerCredentialResponse(
-            id=db_credential.id,
-            user_id=db_credential.user_id,
-            broker_config_id=db_credential.broker_config_id,
-            broker_name=db_credential.broker_config.broker_name,
-            broker_display_name=db_credential.broker_config.display_name,
-            broker_type=db_credential.broker_config.broker_type,
-            is_active=db_credential.is_active,
-            is_testnet=db_credential.is_testnet,
-            validation_status=db_credential.validation_status,
-            last_validated_at=db_credential.last_validated_at,
-            validation_error=db_credential.validation_error,
-            created_at=db_credential.created_at,
-            updated_at=db_credential.updated_at,
-            has_api_key=bool(db_credential.api_key_encrypted),
-            has_api_secret=bool(db_credential.api_secret_encrypted),
-            has_api_passphrase=bool(db_credential.api_passphrase_encrypted),
+        # Transformar a response (has_* en SQL, sin cargar los secrets)
+        return crud_brokers.get_broker_credential_response(
+            db, credential_id=db_credential.id, user_id=user_id
         )
         
     except ValueError as e:
@@ -268,23 +235,8 @@ async def update_broker_credential(
                 detail=f"Credential {credential_id} not found"
             )
         
-        return models.BrokerCredentialResponse(
-            id=db_credential.id,
-            user_id=db_credential.user_id,
-            broker_config_id=db_credential.broker_config_id,
-            broker_name=db_credential.broker_config.broker_name,
-            broker_display_name=db_credential.broker_config.display_name,
-            broker_type=db_credential.broker_config.broker_type,
-            is_active=db_credential.is_active,
-            is_testnet=db_credential.is_testnet,
-            validation_status=db_credential.validation_status,
-            last_validated_at=db_credential.last_validated_at,
-            validation_error=db_credential.validation_error,
-            created_at=db_credential.created_at,
-            updated_at=db_credential.updated_at,
-            has_api_key=bool(db_credential.api_key_encrypted),
-            has_api_secret=bool(db_credential.api_secret_encrypted),
-            has_api_passphrase=bool(db_credential.api_passphrase_encrypted),
+        return crud_brokers.get_broker_credential_response(
+            db, credential_id=db_credential.id, user_id=user_id
         )
         
     except Exception as e:
@@ -349,9 +301,9 @@ async def validate_broker_credential(
         result = BrokerValidator.validate_credentials(
             broker_name=credential.broker_config.broker_name,
             broker_type=credential.broker_config.broker_type,
-            api_key=getattr(credential, 'api_key_decrypted', None),
-            api_secret=getattr(credential, 'api_secret_decrypted', None),
-            api_passphrase=getattr(credential, 'api_passphrase_decrypted', None),
+            api_key=credential.api_key_decrypted,
+            api_secret=credential.api_secret_decrypted,
+            api_passphrase=credential.api_passphrase_decrypted,
             is_testnet=credential.is_testnet
         )
         
@@ -6,34 +6,39 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
 from api.database import get_db
+from api.dependencies import get_data_fetcher
 from api.models import MarketDataRequest
 from utils.data_fetcher import DataFetcher
 
 router = APIRouter(prefix="/api", tags=["market-data"])
-data_fetcher = DataFetcher()
 
 
 @router.post("/fetch-data")
-async def fetch_market_data(request: MarketDataRequest, db: Session = Depends(get_db)):
+async def fetch_market_data(
+    request: MarketDataRequest,
+    data_fetcher: DataFetcher = Depends(get_data_fetcher)
+):
     """Fetch and store market data"""
     try:
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=request.days)
-        
-        data = data_fetcher.get_data(
+        # Solo necesitamos el conteo: no materializamos las filas guardadas
+        result = data_fetcher.fetch_and_store_binance_data(
             symbol=request.symbol,
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat(),
-            db=db
+            days=request.days
         )
         
+        if not result['success']:
+            raise HTTPException(status_code=502, detail=result['error'])
+        
+        count = result['records_saved']
         return {
             "success": True,
-            "message": f"Fetched {len(data)} records for {request.symbol}",
+            "message": f"Fetched {count} records for {request.symbol}",
             "symbol": request.symbol,
-            "records": len(data)
+            "records": count
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
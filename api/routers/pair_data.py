@@ -9,6 +9,7 @@ import pandas as pd
 
 from api.database import get_db
 from api import crud
+from strategies.indicators import rolling_mean, rolling_std
 
 router = APIRouter(prefix="/api", tags=["pair-data"])
 
@@ -30,19 +31,22 @@ async def get_pair_data(
         end = datetime.fromisoformat(end_date)
         
         # Fetch data - usar argumentos con nombre explícitos
-        data_a = crud.get_market_data(
+        # (la fecha 'YYYY-MM-DD' ya viene formateada desde la DB)
+        data_a = crud.get_close_prices(
             db=db,
             symbol=symbol_a,
             start_date=start,
             end_date=end,
             timeframe='1d'
         )
-        data_b = crud.get_market_data(
+        # Las fechas salen de symbol_a; de symbol_b solo hace falta el cierre
+        data_b = crud.get_close_prices(
             db=db,
             symbol=symbol_b,
             start_date=start,
             end_date=end,
-            timeframe='1d'
+            timeframe='1d',
+            with_date_str=False
         )
         
         if not data_a or not data_b:
@@ -52,15 +56,8 @@ async def get_pair_data(
             )
         
         # Convert to DataFrames
-        df_a = pd.DataFrame([{
-            'timestamp': d.timestamp,
-            'close': d.close
-        } for d in data_a])
-        
-        df_b = pd.DataFrame([{
-            'timestamp': d.timestamp,
-            'close': d.close
-        } for d in data_b])
+        df_a = pd.DataFrame(data_a, columns=['timestamp', 'date_str', 'close'])
+        df_b = pd.DataFrame(data_b, columns=['timestamp', 'close'])
         
         # Align timestamps
         merged = pd.merge(df_a, df_b, on='timestamp', suffixes=('_a', '_b'), how='inner')
@@ -78,15 +75,12 @@ async def get_pair_data(
         # Calculate spread and z-score
         merged['spread'] = merged['close_a_norm'] - merged['close_b_norm']
         window = 20
-        merged['spread_ma'] = merged['spread'].rolling(window=window).mean()
-        merged['spread_std'] = merged['spread'].rolling(window=window).std()
+        merged['spread_ma'] = rolling_mean(merged['spread'], window)
+        merged['spread_std'] = rolling_std(merged['spread'], window)
         merged['z_score'] = (merged['spread'] - merged['spread_ma']) / merged['spread_std']
         
-        # Format response
-        merged['timestamp'] = pd.to_datetime(merged['timestamp']).dt.strftime('%Y-%m-%d')
-        
         return {
-            'timestamps': merged['timestamp'].tolist(),
+            'timestamps': merged['date_str'].tolist(),
             'symbol_a': {
                 'name': symbol_a,
                 'prices': merged['close_a'].tolist(),
@@ -7,13 +7,13 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from api.database import get_db
+from api.dependencies import get_data_fetcher
 from api.models import StrategyInfo, BacktestRequest, BacktestResponse
 from api.services.strategy_registry import registry
 from api.services.backtest_service import BacktestService
 from utils.data_fetcher import DataFetcher
 
 router = APIRouter(prefix="/api", tags=["strategies"])
-data_fetcher = DataFetcher()
 
 
 @router.get("/strategies", response_model=List[StrategyInfo])
@@ -31,7 +31,11 @@ async def get_strategies():
 
 
 @router.post("/backtest", response_model=BacktestResponse)
-async def run_backtest(request: BacktestRequest, db: Session = Depends(get_db)):
+async def run_backtest(
+    request: BacktestRequest,
+    db: Session = Depends(get_db),
+    data_fetcher: DataFetcher = Depends(get_data_fetcher)
+):
     """Execute a backtest"""
     try:
         # Validate strategy exists
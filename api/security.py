@@ -7,9 +7,20 @@ from typing import Optional
 from cryptography.fernet import Fernet
 from functools import lru_cache
 
+try:
+    # Implementación en Rust del mismo formato de token Fernet (opcional)
+    import rfernet
+except ImportError:
+    rfernet = None
+
 logger = logging.getLogger(__name__)
 
 
+def _is_production() -> bool:
+    """True si APP_ENV indica producción (sin keys temporales de fallback)"""
+    return os.getenv("APP_ENV", "").lower() in ("prod", "production")
+
+
 class EncryptionService:
     """Servicio de encriptación/desencriptación de credenciales"""
     
@@ -24,6 +35,8 @@ class EncryptionService:
             encryption_key = os.getenv("ENCRYPTION_KEY")
             
         if not encryption_key:
+            if _is_production():
+                raise ValueError("ENCRYPTION_KEY is required when APP_ENV=production")
             # Generar una key temporal para desarrollo
             temp_key = Fernet.generate_key().decode()
             logger.warning("⚠️  No ENCRYPTION_KEY found in environment")
@@ -32,17 +45,25 @@ class EncryptionService:
             encryption_key = temp_key
         
         # Si es string, convertir a bytes
-        if isinstance(encryption_key, str):
+        try:
             encryption_key = encryption_key.encode()
+        except AttributeError:
+            pass  # Ya es bytes
             
         try:
             self.cipher = Fernet(encryption_key)
         except Exception as e:
             logger.error(f"❌ Invalid encryption key: {e}")
+            if _is_production():
+                raise ValueError(f"Invalid ENCRYPTION_KEY: {e}") from e
             # Generar nueva key como fallback
             new_key = Fernet.generate_key()
             logger.warning(f"⚠️  Generated new key: {new_key.decode()}")
             self.cipher = Fernet(new_key)
+            encryption_key = new_key
+        
+        # Misma key y mismo formato de token; solo cambia la implementación
+        self._fast_cipher = rfernet.Fernet(encryption_key.decode()) if rfernet else None
     
     def encrypt(self, plain_text: str) -> str:
         """
@@ -61,6 +82,8 @@ class EncryptionService:
             return ""
             
         try:
+            if self._fast_cipher is not None:
+                return self._fast_cipher.encrypt(plain_text.encode())
             encrypted_bytes = self.cipher.encrypt(plain_text.encode())
             return encrypted_bytes.decode()
         except Exception as e:
@@ -84,6 +107,8 @@ class EncryptionService:
             return ""
             
         try:
+            if self._fast_cipher is not None:
+                return self._fast_cipher.decrypt(encrypted_text).decode()
             decrypted_bytes = self.cipher.decrypt(encrypted_text.encode())
             return decrypted_bytes.decode()
         except Exception as e:
@@ -2,8 +2,9 @@
 Backtest Service - Single Responsibility Principle
 Handles backtest execution logic
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
@@ -11,6 +12,10 @@ from backtesting.backtester import Backtester, MultiSymbolBacktester
 from api.services.strategy_registry import registry
 from utils.data_fetcher import DataFetcher
 
+# Máximo de consultas simultáneas al cargar datos multi-símbolo
+# (por debajo del pool_size del engine)
+MAX_FETCH_WORKERS = 8
+
 
 class BacktestService:
     """
@@ -40,15 +45,8 @@ class BacktestService:
         # Merge params
         strategy_params = {**strategy_info['params'], **(params or {})}
         
-        # Fetch data
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        data = self.data_fetcher.fetch_from_db(
-            symbol=symbol,
-            start_date=start_date,
-            end_date=end_date
-        )
+        # Fetch data (cacheado en el DataFetcher compartido)
+        data = self.data_fetcher.fetch_recent(symbol=symbol, days=days)
         
         if data.empty:
             raise ValueError(f"No data available for {symbol}")
@@ -64,8 +62,8 @@ class BacktestService:
         
         results = backtester.run(data)
         
-        # Transform trades to frontend format
-        results['trades'] = self._transform_trades(results.get('trades', []))
+        # Transform trades to frontend format (un solo símbolo, ya alternados)
+        results['trades'] = self._transform_trades_fast(results.get('trades', []))
         
         return results
     
@@ -88,18 +86,16 @@ class BacktestService:
         strategy_params = {**strategy_info['params'], **(params or {})}
         
         # Fetch data for all symbols
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        # Cada fetch_from_db abre su propia sesión, así que las consultas
+        # pueden ir en paralelo (el pool del engine es thread-safe)
+        def fetch(symbol: str) -> pd.DataFrame:
+            return self.data_fetcher.fetch_recent(symbol=symbol, days=days)
         
         data_dict = {}
-        for symbol in symbols:
-            data = self.data_fetcher.fetch_from_db(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date
-            )
-            if not data.empty:
-                data_dict[symbol] = data
+        with ThreadPoolExecutor(max_workers=min(len(symbols), MAX_FETCH_WORKERS) or 1) as executor:
+            for symbol, data in zip(symbols, executor.map(fetch, symbols)):
+                if not data.empty:
+                    data_dict[symbol] = data
         
         if len(data_dict) != len(symbols):
             raise ValueError(f"Could not fetch data for all symbols")
@@ -128,47 +124,45 @@ class BacktestService:
         if not trades:
             return []
         
-        # Group trades into entry/exit pairs
-        formatted_trades = []
-        
         # Separate by symbol
         trades_by_symbol = {}
         for trade in trades:
-            symbol = trade.get('symbol', 'UNKNOWN')
-            if symbol not in trades_by_symbol:
-                trades_by_symbol[symbol] = []
-            trades_by_symbol[symbol].append(trade)
+            trades_by_symbol.setdefault(trade.get('symbol', 'UNKNOWN'), []).append(trade)
         
-        # Process each symbol's trades
+        formatted_trades = []
         for symbol, symbol_trades in trades_by_symbol.items():
-            i = 0
-            while i < len(symbol_trades) - 1:
-                entry = symbol_trades[i]
-                exit_trade = symbol_trades[i + 1]
-                
-                # Calculate return
-                entry_price = entry.get('price', 0)
-                exit_price = exit_trade.get('price', 0)
-                
-                if entry.get('type') in ['BUY', 'LONG']:
-                    return_pct = ((exit_price - entry_price) / entry_price * 100) if entry_price > 0 else 0
-                    trade_type = 'LONG'
-                else:  # SHORT
-                    return_pct = ((entry_price - exit_price) / entry_price * 100) if entry_price > 0 else 0
-                    trade_type = 'SHORT'
-                
-                formatted_trades.append({
-                    'symbol': symbol,
-                    'trade_type': trade_type,
-                    'entry_date': entry.get('date'),
-                    'exit_date': exit_trade.get('date'),
-                    'entry_price': entry_price,
-                    'exit_price': exit_price,
-                    'return_pct': return_pct,
-                    'shares': entry.get('shares', 0)
-                })
-                
-                i += 2
+            formatted_trades.extend(self._transform_trades_fast(symbol_trades, symbol))
+        
+        return formatted_trades
+    
+    def _transform_trades_fast(self, trades: list, symbol: str = 'UNKNOWN') -> list:
+        """
+        Transform trades of a single symbol that already alternate entry/exit
+        (como los emite Backtester); un par incompleto al final se descarta
+        """
+        formatted_trades = []
+        for entry, exit_trade in zip(trades[0::2], trades[1::2]):
+            # Calculate return
+            entry_price = entry.get('price', 0)
+            exit_price = exit_trade.get('price', 0)
+            
+            if entry.get('type') in ('BUY', 'LONG'):
+                return_pct = ((exit_price - entry_price) / entry_price * 100) if entry_price > 0 else 0
+                trade_type = 'LONG'
+            else:  # SHORT
+                return_pct = ((entry_price - exit_price) / entry_price * 100) if entry_price > 0 else 0
+                trade_type = 'SHORT'
+            
+            formatted_trades.append({
+                'symbol': symbol,
+                'trade_type': trade_type,
+                'entry_date': entry.get('date'),
+                'exit_date': exit_trade.get('date'),
+                'entry_price': entry_price,
+                'exit_price': exit_price,
+                'return_pct': return_pct,
+                'shares': entry.get('shares', 0)
+            })
         
         return formatted_trades
     
@@ -177,7 +171,7 @@ class BacktestService:
         if not data_dict:
             return {}
         
-        # Get common timestamps
+        # Get common timestamps (con índices ordenados pandas hace un merge lineal)
         common_index = None
         for df in data_dict.values():
             if common_index is None:
@@ -185,8 +179,13 @@ class BacktestService:
             else:
                 common_index = common_index.intersection(df.index)
         
-        # Filter all dataframes to common timestamps
+        # Filter all dataframes to common timestamps (posiciones vía
+        # búsqueda binaria en vez de lookup por etiqueta)
         return {
-            symbol: df.loc[common_index]
+            symbol: (
+                df.iloc[np.searchsorted(df.index.to_numpy(), common_index.to_numpy())]
+                if df.index.is_monotonic_increasing and df.index.is_unique
+                else df.loc[common_index]
+            )
             for symbol, df in data_dict.items()
         }
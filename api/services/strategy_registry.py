@@ -2,7 +2,8 @@
 Strategy Registry Service - Single Responsibility Principle
 Manages strategy registration and retrieval
 """
-from typing import Dict, Type, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Any, Optional
 from strategies.base_strategy import BaseStrategy
 from strategies.base_multi_symbol_strategy import MultiSymbolStrategy
 
@@ -14,7 +15,7 @@ class StrategyRegistry:
     """
     
     def __init__(self):
-        self._strategies: Dict[str, Dict[str, Any]] = {}
+        self._strategies: Dict[str, Mapping[str, Any]] = {}
     
     def register(
         self,
@@ -41,20 +42,21 @@ class StrategyRegistry:
         if not issubclass(strategy_class, BaseStrategy):
             raise ValueError(f"{strategy_class} must inherit from BaseStrategy")
         
-        self._strategies[strategy_id] = {
+        # Entradas congeladas: se comparten entre requests sin copiarlas
+        self._strategies[strategy_id] = MappingProxyType({
             'class': strategy_class,
             'name': name,
             'description': description,
-            'params': default_params,
+            'params': MappingProxyType(dict(default_params)),
             'type': strategy_type,
-            'default_symbols': default_symbols or []
-        }
+            'default_symbols': tuple(default_symbols or ())
+        })
     
-    def get_strategy_info(self, strategy_id: str) -> Dict[str, Any]:
-        """Get strategy metadata"""
+    def get_strategy_info(self, strategy_id: str) -> Mapping[str, Any]:
+        """Get strategy metadata (read-only view, copy before mutating)"""
         if strategy_id not in self._strategies:
             raise KeyError(f"Strategy '{strategy_id}' not found")
-        return self._strategies[strategy_id].copy()
+        return self._strategies[strategy_id]
     
     def get_strategy_class(self, strategy_id: str) -> Type[BaseStrategy]:
         """Get strategy class"""
@@ -0,0 +1,339 @@
+"""
+Núcleo numérico del Backtester
+
+La simulación de capital/posición tiene dependencias entre barras, así que
+se compila con Numba cuando está instalado. Sin Numba se ejecuta el mismo
+código en Python: solo itera las barras con señal y rellena la curva de
+equity por tramos con NumPy.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op cuando Numba no está instalado"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# Por debajo de este tamaño el overhead de NumExpr no compensa
+NUMEXPR_MIN_SIZE = 10_000
+
+
+# Códigos de tipo de trade devueltos por simulate / simulate_multi
+TRADE_BUY = 1
+TRADE_SELL = -1
+TRADE_SHORT = -2
+TRADE_COVER = 2
+
+
+# Sin firma explícita: pandas devuelve arrays de solo lectura y el
+# dispatcher de Numba los especializa solo (cache=True persiste el binario)
+@njit(cache=True)
+def simulate(closes, signals, initial_capital, buy_factor, sell_factor, equity):
+    """
+    Simular una estrategia long-only sobre arrays de precios y señales
+
+    Args:
+        closes: Precios de cierre (float64)
+        signals: Señales por barra (1 compra, -1 venta, otro valor = mantener)
+        initial_capital: Capital inicial
+        buy_factor: Multiplicador del precio de compra (1 + comisión + slippage)
+        sell_factor: Multiplicador del precio de venta (1 - comisión - slippage)
+        equity: Buffer float64 de salida (mismo largo que closes); permite
+            reutilizar la memoria entre corridas
+
+    Returns:
+        Tupla (equity, trade_idx, trade_type, trade_shares, trade_capital,
+        capital, position). Los arrays de trades ya vienen recortados al
+        número de operaciones ejecutadas.
+    """
+    # Dos punteros sobre las señales: sin posición solo importa la próxima
+    # compra y con posición la próxima venta; las señales repetidas
+    # (compra estando comprado, venta sin posición) se saltan con searchsorted
+    entries = np.flatnonzero(signals == 1)
+    exits = np.flatnonzero(signals == -1)
+
+    # Cada trade ocurre en una barra con señal: ese es el tope de trades
+    max_trades = entries.shape[0] + exits.shape[0]
+    trade_idx = np.empty(max_trades, dtype=np.int64)
+    trade_type = np.empty(max_trades, dtype=np.int8)
+    trade_shares = np.empty(max_trades, dtype=np.int64)
+    trade_capital = np.empty(max_trades)
+    n_trades = 0
+
+    capital = initial_capital
+    position = 0
+    segment_start = 0
+    next_entry = 0
+    next_exit = 0
+
+    while True:
+        # Buy signal
+        if position == 0:
+            if next_entry == entries.shape[0]:
+                break
+            i = entries[next_entry]
+            next_entry += 1
+            price = closes[i]
+            shares = int(capital / (price * buy_factor))
+            if shares <= 0:
+                continue
+            # Cerrar el tramo anterior con el estado previo al trade
+            equity[segment_start:i] = capital + position * closes[segment_start:i]
+            capital -= shares * price * buy_factor
+            position = shares
+            trade_type[n_trades] = TRADE_BUY
+            next_exit = np.searchsorted(exits, i)
+
+        # Sell signal
+        else:
+            if next_exit == exits.shape[0]:
+                break
+            i = exits[next_exit]
+            next_exit += 1
+            price = closes[i]
+            equity[segment_start:i] = capital + position * closes[segment_start:i]
+            capital += position * price * sell_factor
+            trade_type[n_trades] = TRADE_SELL
+            shares = position
+            position = 0
+            next_entry = np.searchsorted(entries, i)
+
+        trade_idx[n_trades] = i
+        trade_shares[n_trades] = shares
+        trade_capital[n_trades] = capital
+        n_trades += 1
+        segment_start = i
+
+    equity[segment_start:] = capital + position * closes[segment_start:]
+
+    return (
+        equity,
+        trade_idx[:n_trades],
+        trade_type[:n_trades],
+        trade_shares[:n_trades],
+        trade_capital[:n_trades],
+        capital,
+        position
+    )
+
+
+@njit(cache=True)
+def _fill_portfolio_equity(equity, closes, start, stop, capital, positions):
+    """Rellenar equity[start:stop] = cash + posiciones a precio de cierre"""
+    segment = equity[start:stop]
+    segment[:] = capital
+    for j in range(positions.shape[0]):
+        if positions[j] != 0:
+            segment += positions[j] * closes[start:stop, j]
+
+
+@njit(cache=True)
+def simulate_multi(closes, signals, initial_capital, buy_factor, sell_factor):
+    """
+    Simular una cartera long/short de varios símbolos con capital compartido
+
+    Args:
+        closes: Matriz de precios (barras x símbolos, float64)
+        signals: Matriz de señales (1 compra/cubre, -1 vende/abre corto)
+        initial_capital: Capital inicial
+        buy_factor: Multiplicador del precio de compra (1 + comisión + slippage)
+        sell_factor: Multiplicador del precio de venta (1 - comisión - slippage)
+
+    Returns:
+        Tupla (equity, trade_idx, trade_symbol, trade_type, trade_shares,
+        trade_capital, capital, positions). Los arrays de trades ya vienen
+        recortados; positions queda con las posiciones abiertas al final.
+    """
+    n, n_symbols = closes.shape
+    equity = np.empty(n)
+    positions = np.zeros(n_symbols, dtype=np.int64)
+
+    # Cada señal genera a lo sumo dos trades (cerrar + abrir)
+    is_event = (signals == 1) | (signals == -1)
+    max_trades = 2 * np.count_nonzero(is_event)
+    trade_idx = np.empty(max_trades, dtype=np.int64)
+    trade_symbol = np.empty(max_trades, dtype=np.int64)
+    trade_type = np.empty(max_trades, dtype=np.int8)
+    trade_shares = np.empty(max_trades, dtype=np.int64)
+    trade_capital = np.empty(max_trades)
+    n_trades = 0
+
+    capital = initial_capital
+    segment_start = 0
+
+    # Solo las barras con alguna señal pasan por la lógica de trades; entre
+    # ellas la equity se rellena por tramos con las posiciones vigentes
+    event_rows = np.flatnonzero(is_event.sum(axis=1))
+
+    for i in event_rows:
+        _fill_portfolio_equity(equity, closes, segment_start, i, capital, positions)
+        segment_start = i
+
+        for j in range(n_symbols):
+            signal = signals[i, j]
+            price = closes[i, j]
+            current_position = positions[j]
+
+            # Buy signal (enter long or exit short)
+            if signal == 1:
+                if current_position <= 0:
+                    # El capital se reparte entre todos los símbolos
+                    position_capital = capital / n_symbols
+
+                    if current_position < 0:
+                        # Close short: buy back shares
+                        capital -= -current_position * price * buy_factor
+                        trade_idx[n_trades] = i
+                        trade_symbol[n_trades] = j
+                        trade_type[n_trades] = TRADE_COVER
+                        trade_shares[n_trades] = -current_position
+                        trade_capital[n_trades] = capital
+                        n_trades += 1
+                        positions[j] = 0
+
+                    # Open long position
+                    shares = int(position_capital / (price * buy_factor))
+                    if shares > 0:
+                        capital -= shares * price * buy_factor
+                        positions[j] = shares
+                        trade_idx[n_trades] = i
+                        trade_symbol[n_trades] = j
+                        trade_type[n_trades] = TRADE_BUY
+                        trade_shares[n_trades] = shares
+                        trade_capital[n_trades] = capital
+                        n_trades += 1
+
+            # Sell signal (enter short or exit long)
+            elif signal == -1:
+                if current_position >= 0:
+                    if current_position > 0:
+                        # Close long: sell shares
+                        capital += current_position * price * sell_factor
+                        trade_idx[n_trades] = i
+                        trade_symbol[n_trades] = j
+                        trade_type[n_trades] = TRADE_SELL
+                        trade_shares[n_trades] = current_position
+                        trade_capital[n_trades] = capital
+                        n_trades += 1
+                        positions[j] = 0
+
+                    # Open short position
+                    position_capital = capital / n_symbols
+                    shares = int(position_capital / (price * buy_factor))
+                    if shares > 0:
+                        capital += shares * price * sell_factor
+                        positions[j] = -shares
+                        trade_idx[n_trades] = i
+                        trade_symbol[n_trades] = j
+                        trade_type[n_trades] = TRADE_SHORT
+                        trade_shares[n_trades] = shares
+                        trade_capital[n_trades] = capital
+                        n_trades += 1
+
+    # Equity: cash + valor de las posiciones (los cortos restan)
+    _fill_portfolio_equity(equity, closes, segment_start, n, capital, positions)
+
+    return (
+        equity,
+        trade_idx[:n_trades],
+        trade_symbol[:n_trades],
+        trade_type[:n_trades],
+        trade_shares[:n_trades],
+        trade_capital[:n_trades],
+        capital,
+        positions
+    )
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, error_model='numpy')
+    def equity_metrics(equity):
+        """
+        Calcular Sharpe anualizado y máximo drawdown en una sola pasada
+
+        Args:
+            equity: Curva de equity (float64)
+
+        Returns:
+            Tupla (sharpe_ratio, max_drawdown_pct)
+        """
+        n = equity.shape[0]
+        if n == 0:
+            return 0.0, 0.0
+
+        # Welford para media/varianza de los retornos
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        running_max = equity[0]
+        max_drawdown = (equity[0] - running_max) / running_max
+
+        for i in range(1, n):
+            ret = (equity[i] - equity[i - 1]) / equity[i - 1]
+            if not np.isnan(ret):
+                count += 1
+                delta = ret - mean
+                mean += delta / count
+                m2 += delta * (ret - mean)
+
+            if equity[i] > running_max:
+                running_max = equity[i]
+            drawdown = (equity[i] - running_max) / running_max
+            if drawdown < max_drawdown:
+                max_drawdown = drawdown
+
+        sharpe_ratio = 0.0
+        if count > 1:
+            std = np.sqrt(m2 / (count - 1))
+            if std != 0:
+                sharpe_ratio = np.sqrt(252) * (mean / std)
+
+        return sharpe_ratio, max_drawdown * 100
+else:
+    def equity_metrics(equity):
+        """
+        Calcular Sharpe anualizado y máximo drawdown (versión NumPy)
+
+        Args:
+            equity: Curva de equity (float64)
+
+        Returns:
+            Tupla (sharpe_ratio, max_drawdown_pct)
+        """
+        if len(equity) == 0:
+            return 0.0, 0.0
+
+        # NumExpr evalúa cada expresión en una pasada, sin temporales
+        use_numexpr = ne is not None and len(equity) > NUMEXPR_MIN_SIZE
+
+        if use_numexpr:
+            prev, curr = equity[:-1], equity[1:]
+            returns = ne.evaluate('(curr - prev) / prev')
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                returns = np.diff(equity) / equity[:-1]
+        returns = returns[~np.isnan(returns)]
+
+        sharpe_ratio = 0.0
+        if len(returns) > 1:
+            returns_std = returns.std(ddof=1)
+            if returns_std != 0:
+                sharpe_ratio = np.sqrt(252) * (returns.mean() / returns_std)
+
+        running_max = np.maximum.accumulate(equity)
+        if use_numexpr:
+            drawdown = ne.evaluate('(equity - running_max) / running_max')
+        else:
+            drawdown = (equity - running_max) / running_max
+        return sharpe_ratio, drawdown.min() * 100
@@ -2,27 +2,119 @@
 Backtesting Engine
 """
 from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import compress
+import hashlib
+import os
+import threading
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import logging
 
 from strategies.base_strategy import BaseStrategy
+from backtesting._engine import (
+    simulate, simulate_multi, equity_metrics, NUMBA_AVAILABLE,
+    TRADE_BUY, TRADE_SELL, TRADE_SHORT, TRADE_COVER
+)
 from utils.results_logger import ResultsLogger
 
 
+# Columnas que no son indicadores (el resto va al gráfico)
+_NON_INDICATOR_COLUMNS = frozenset(['open', 'high', 'low', 'close', 'volume', 'signal'])
+
+_TRADE_LABELS = {
+    TRADE_BUY: 'BUY',
+    TRADE_SELL: 'SELL',
+    TRADE_SHORT: 'SHORT',
+    TRADE_COVER: 'COVER'
+}
+
+
+@dataclass
+class Trades:
+    """
+    Trades in columnar form (one array per field)
+    
+    En el backtester simple los trades alternan compra/venta (posiciones
+    pares = entradas). En multi-símbolo `symbols` guarda el índice del
+    símbolo de cada trade dentro de `symbol_names`.
+    """
+    types: np.ndarray     # TRADE_BUY / TRADE_SELL / TRADE_SHORT / TRADE_COVER
+    dates: pd.Index
+    prices: np.ndarray
+    shares: np.ndarray
+    capitals: np.ndarray
+    symbols: Optional[np.ndarray] = None
+    symbol_names: Optional[List[str]] = None
+    
+    def __len__(self) -> int:
+        return len(self.types)
+    
+    def to_list_of_dicts(self) -> List[Dict[str, Any]]:
+        """Convert to the list-of-dicts format used in the results"""
+        records = [
+            {
+                'type': _TRADE_LABELS[kind],
+                'date': date,
+                'price': price,
+                'shares': shares,
+                'capital': capital
+            }
+            for kind, date, price, shares, capital in zip(
+                self.types.tolist(),
+                self.dates,
+                self.prices.tolist(),
+                self.shares.tolist(),
+                self.capitals.tolist()
+            )
+        ]
+        if self.symbols is None:
+            return records
+        return [
+            {'symbol': self.symbol_names[j], **record}
+            for j, record in zip(self.symbols.tolist(), records)
+        ]
+
+
 class Backtester:
     """
     Backtesting engine for trading strategies
     """
     
+    # Cache compartido de indicadores/señales para barridos de parámetros:
+    # (huella de los datos, cache_key de la estrategia) -> DataFrame preparado
+    PREPARED_CACHE_MAXSIZE = 16
+    _prepared_cache = OrderedDict()
+    _prepared_lock = threading.Lock()
+    
+    # Un solo hilo de I/O compartido por todas las instancias: el guardado de
+    # una corrida se solapa con el cálculo de la siguiente, se mantiene el
+    # orden de escritura y un barrido no crea un hilo por Backtester
+    _io_pool: Optional[ThreadPoolExecutor] = None
+    _io_pool_lock = threading.Lock()
+    
+    @classmethod
+    def _get_io_pool(cls) -> ThreadPoolExecutor:
+        """Crear el pool de I/O compartido la primera vez que se guarda"""
+        with cls._io_pool_lock:
+            if cls._io_pool is None:
+                cls._io_pool = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='backtest-io'
+                )
+            return cls._io_pool
+    
     def __init__(
         self,
         strategy: BaseStrategy,
         initial_capital: float = 10000.0,
         commission: float = 0.001,
         slippage: float = 0.0,
-        save_results: bool = False
+        save_results: bool = False,
+        use_float32: bool = False,
+        cache_indicators: bool = False
     ):
         """
         Initialize backtester
@@ -33,20 +125,32 @@ class Backtester:
             commission: Commission rate (e.g., 0.001 = 0.1%)
             slippage: Slippage rate
             save_results: Si True, guarda resultados automáticamente
+            use_float32: Si True, convierte OHLCV a float32 antes de calcular
+                indicadores (menos memoria; el capital sigue en float64)
+            cache_indicators: Si True, reutiliza indicadores y señales ya
+                calculados para los mismos datos y parámetros de estrategia
         """
         self.strategy = strategy
         self.initial_capital = initial_capital
         self.commission = commission
         self.slippage = slippage
+        # Factores de costo constantes, calculados una sola vez
+        self._buy_factor = 1.0 + commission + slippage
+        self._sell_factor = 1.0 - commission - slippage
+        # Buffer de equity reutilizado entre corridas (barridos de parámetros)
+        self._eq_buf: Optional[np.ndarray] = None
+        self.use_float32 = use_float32
+        self.cache_indicators = cache_indicators
         self.results = {}
+        # Datos con indicadores y señales de la última corrida (solo lectura:
+        # con cache_indicators es el mismo DataFrame que guarda el caché)
+        self.data_with_signals: Optional[pd.DataFrame] = None
         self.save_results = save_results
         self.results_logger = ResultsLogger() if save_results else None
+        self._persist = save_results and self.results_logger is not None
+        self._save_future: Optional[Future] = None
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # La configuración de logging queda a cargo del entrypoint (main.py, API)
         self.logger = logging.getLogger(__name__)
         
     def run(self, data: pd.DataFrame) -> Dict[str, Any]:
@@ -59,160 +163,219 @@ class Backtester:
         Returns:
             Dictionary with backtest results
         """
-        self.logger.info(f"Starting backtest for {self.strategy.name}")
-        
-        # Calculate indicators and generate signals
-        data = self.strategy.calculate_indicators(data.copy())
-        data = self.strategy.generate_signals(data)
+        self.logger.info("Starting backtest for %s", self.strategy.name)
         
-        # Initialize tracking variables
-        capital = self.initial_capital
-        position = 0
-        trades = []
-        equity_curve = []
+        if self.use_float32:
+            data = data.astype({
+                col: np.float32
+                for col in ['open', 'high', 'low', 'close', 'volume']
+                if col in data.columns
+            })
         
-        # Simulate trading
-        for i in range(len(data)):
-            row = data.iloc[i]
-            signal = row.get('signal', 0)
-            price = float(row['close'])  # Convert to native Python float
-            
-            # Buy signal
-            if signal == 1 and position == 0:
-                shares = int(capital / (price * (1 + self.commission + self.slippage)))
-                if shares > 0:
-                    cost = shares * price * (1 + self.commission + self.slippage)
-                    capital -= cost
-                    position = shares
-                    trades.append({
-                        'type': 'BUY',
-                        'date': row.name,
-                        'price': float(price),
-                        'shares': int(shares),
-                        'capital': float(capital)
-                    })
-                    self.logger.info(f"BUY: {shares} shares at {price}")
-            
-            # Sell signal
-            elif signal == -1 and position > 0:
-                revenue = position * price * (1 - self.commission - self.slippage)
-                capital += revenue
-                trades.append({
-                    'type': 'SELL',
-                    'date': row.name,
-                    'price': float(price),
-                    'shares': int(position),
-                    'capital': float(capital)
-                })
-                self.logger.info(f"SELL: {position} shares at {price}")
-                position = 0
-            
-            # Calculate current equity
-            current_equity = capital + (position * price if position > 0 else 0)
-            equity_curve.append(current_equity)
+        # Calculate indicators and generate signals
+        if self.cache_indicators:
+            data = self._prepare_cached(data)
+        else:
+            data = self._prepare(data)
+        self.data_with_signals = data
+        
+        # Extraer arrays una sola vez y simular con el núcleo compilado.
+        # El kernel de Numba lee precios float32 sin copiarlos (capital y equity
+        # siguen en float64); sin Numba, NumPy calcularía los tramos de equity
+        # en float32, así que ahí se suben a float64
+        price_dtype = np.float32 if self.use_float32 and NUMBA_AVAILABLE else np.float64
+        closes = data['close'].to_numpy(dtype=price_dtype)
+        if 'signal' in data.columns:
+            signals = data['signal'].to_numpy(dtype=np.float64)
+        else:
+            signals = np.zeros(len(data))
+        
+        n = len(closes)
+        if self._eq_buf is None or self._eq_buf.size < n:
+            self._eq_buf = np.empty(n, dtype=np.float64)
+        
+        (
+            equity,
+            trade_idx,
+            trade_type,
+            trade_shares,
+            trade_capital,
+            capital,
+            position
+        ) = simulate(
+            closes,
+            signals,
+            float(self.initial_capital),
+            float(self._buy_factor),
+            float(self._sell_factor),
+            self._eq_buf[:n]
+        )
+        position = int(position)
         
-        # Close any remaining position
+        # Close any remaining position (se agrega como un trade más al final)
         if position > 0:
-            final_price = float(data.iloc[-1]['close'])
-            revenue = position * final_price * (1 - self.commission - self.slippage)
-            capital += revenue
-            trades.append({
-                'type': 'SELL',  # Changed from 'SELL (CLOSE)' to fit in DB
-                'date': data.index[-1],
-                'price': float(final_price),
-                'shares': int(position),
-                'capital': float(capital)
-            })
+            capital += position * float(closes[-1]) * self._sell_factor
+            trade_idx = np.append(trade_idx, n - 1)
+            trade_type = np.append(trade_type, np.int8(TRADE_SELL))
+            trade_shares = np.append(trade_shares, position)
+            trade_capital = np.append(trade_capital, capital)
+        
+        trades = Trades(
+            types=trade_type,
+            dates=data.index[trade_idx],
+            prices=closes[trade_idx],
+            shares=trade_shares,
+            capitals=trade_capital
+        )
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            for kind, shares, price in zip(trades.types, trades.shares, trades.prices):
+                self.logger.info(
+                    "%s: %d shares at %s",
+                    'BUY' if kind == TRADE_BUY else 'SELL', shares, price
+                )
         
         # Calculate metrics
         self.results = self._calculate_metrics(
-            equity_curve,
+            equity,
             trades,
             data
         )
         
-        self.logger.info(f"Backtest completed. Final capital: {capital:.2f}")
+        # Guardar resultados si está habilitado (en segundo plano)
+        if self._persist:
+            self._save_future = self._get_io_pool().submit(
+                self._save,
+                data.attrs.get('symbol', 'UNKNOWN'),
+                dict(self.results),
+                dict(self.strategy.params)
+            )
+        
+        self.logger.info("Backtest completed. Final capital: %.2f", capital)
         return self.results
     
+    def _save(self, symbol: str, results: Dict[str, Any], params: Dict[str, Any]) -> Optional[str]:
+        """Persist one run with the results logger (runs on the I/O thread)"""
+        try:
+            return self.results_logger.save_backtest(
+                strategy_name=self.strategy.name,
+                symbol=symbol,
+                results=results,
+                params=params
+            )
+        except Exception:
+            self.logger.exception("Error saving backtest results")
+            return None
+    
+    def wait_for_save(self) -> Optional[str]:
+        """
+        Wait for the last background save to finish
+        
+        Returns:
+            Path of the saved file, or None if nothing was saved
+        """
+        if self._save_future is None:
+            return None
+        return self._save_future.result()
+    
+    def _prepare(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Calculate indicators and signals for the strategy"""
+        # Copia superficial: las estrategias solo agregan columnas, así que el
+        # DataFrame del llamador no se modifica y no se duplican los datos OHLCV
+        data = self.strategy.calculate_indicators(data.copy(deep=False))
+        return self.strategy.generate_signals(data)
+    
+    def _prepare_cached(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Same as _prepare, reusing results for identical data and params
+        
+        El DataFrame cacheado se comparte entre corridas; run y
+        _calculate_metrics solo lo leen.
+        """
+        digest = hashlib.blake2b(
+            pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes(),
+            digest_size=16
+        ).digest()
+        key = (
+            digest,
+            tuple(data.columns),
+            tuple(str(dtype) for dtype in data.dtypes),
+            self.strategy.cache_key()
+        )
+        
+        with self._prepared_lock:
+            prepared = self._prepared_cache.get(key)
+            if prepared is not None:
+                self._prepared_cache.move_to_end(key)
+                return prepared
+        
+        prepared = self._prepare(data)
+        with self._prepared_lock:
+            self._prepared_cache[key] = prepared
+            self._prepared_cache.move_to_end(key)
+            while len(self._prepared_cache) > self.PREPARED_CACHE_MAXSIZE:
+                self._prepared_cache.popitem(last=False)
+        
+        return prepared
+    
     def _calculate_metrics(
         self,
-        equity_curve: list,
-        trades: list,
+        equity_curve: np.ndarray,
+        trades: Trades,
         data: pd.DataFrame
     ) -> Dict[str, Any]:
         """
         Calculate performance metrics
         
         Args:
-            equity_curve: List of equity values
-            trades: List of trades
+            equity_curve: Array of equity values (se convierte a lista solo al final)
+            trades: Columnar trades from the simulation
             data: Original market data
             
         Returns:
             Dictionary with performance metrics
         """
-        final_capital = equity_curve[-1] if equity_curve else self.initial_capital
+        equity_curve = np.asarray(equity_curve, dtype=np.float64)
+        final_capital = equity_curve[-1] if len(equity_curve) else self.initial_capital
         total_return = (final_capital - self.initial_capital) / self.initial_capital * 100
         
-        # Calculate returns
-        returns = pd.Series(equity_curve).pct_change().dropna()
-        
-        # Sharpe ratio (annualized)
-        sharpe_ratio = 0
-        if len(returns) > 0 and returns.std() != 0:
-            sharpe_ratio = np.sqrt(252) * (returns.mean() / returns.std())
-        
-        # Maximum drawdown
-        equity_series = pd.Series(equity_curve)
-        running_max = equity_series.expanding().max()
-        drawdown = (equity_series - running_max) / running_max
-        max_drawdown = drawdown.min() * 100
+        # Sharpe ratio (annualized) y maximum drawdown en una sola pasada
+        sharpe_ratio, max_drawdown = equity_metrics(equity_curve)
         
-        # Win rate
-        winning_trades = sum(1 for i in range(0, len(trades) - 1, 2) 
-                           if i + 1 < len(trades) and 
-                           trades[i+1]['capital'] > trades[i]['capital'])
+        # Win rate: trades en pares (compra, venta), comparados en bloque
         total_trade_pairs = len(trades) // 2
+        capitals = trades.capitals[:total_trade_pairs * 2]
+        winning_trades = int(np.count_nonzero(capitals[1::2] > capitals[::2]))
         win_rate = (winning_trades / total_trade_pairs * 100) if total_trade_pairs > 0 else 0
         
-        # Convert numpy types to native Python types
-        def to_python_type(value):
-            if isinstance(value, (np.integer, np.floating)):
-                return float(value)
-            if isinstance(value, np.ndarray):
-                return value.tolist()
-            return value
-        
         # Preparar datos de velas con indicadores para el gráfico
-        chart_data = []
-        
         # Usar el DataFrame que ya tiene los indicadores calculados
-        # Filtrar solo las filas donde las MAs tienen valores válidos (después del período de warm-up)
-        display_data = data.dropna(subset=[col for col in data.columns if col not in ['open', 'high', 'low', 'close', 'volume', 'signal']])
-        
-        # Debug: imprimir columnas disponibles
-        print(f"🔍 Columnas en el DataFrame: {list(data.columns)}")
-        print(f"🔍 Filas totales: {len(data)}, Filas con indicadores válidos: {len(display_data)}")
-        if len(display_data) > 0:
-            print(f"🔍 Primera fila con MAs: {display_data.iloc[0].to_dict()}")
+        # Columnas de indicadores: las que declara la estrategia o, si no las
+        # declara, todo lo que no sea OHLCV/signal
+        ohlcv_cols = ['open', 'high', 'low', 'close', 'volume']
+        indicator_cols = self.strategy.indicator_columns
+        if indicator_cols is None:
+            indicator_cols = [col for col in data.columns if col not in _NON_INDICATOR_COLUMNS]
+        else:
+            indicator_cols = list(indicator_cols)
         
-        for idx, row in display_data.iterrows():
-            point = {
-                'timestamp': idx.isoformat() if hasattr(idx, 'isoformat') else str(idx),
-                'open': float(row['open']) if 'open' in row and not pd.isna(row['open']) else None,
-                'high': float(row['high']) if 'high' in row and not pd.isna(row['high']) else None,
-                'low': float(row['low']) if 'low' in row and not pd.isna(row['low']) else None,
-                'close': float(row['close']) if 'close' in row and not pd.isna(row['close']) else None,
-                'volume': float(row['volume']) if 'volume' in row and not pd.isna(row['volume']) else None,
-            }
-            
-            # Agregar indicadores técnicos (ahora todos deberían tener valores)
-            for col in row.index:
-                if col not in ['open', 'high', 'low', 'close', 'volume', 'signal']:
-                    # Ya no filtramos NaN porque dropna() ya lo hizo
-                    point[col] = float(row[col])
-            
-            chart_data.append(point)
+        # Filtrar solo las filas donde las MAs tienen valores válidos (después del período de warm-up)
+        display_data = data.dropna(subset=indicator_cols)
+        
+        # Debug: columnas disponibles (solo si DEBUG está activo)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Columnas en el DataFrame: %s", list(data.columns))
+            self.logger.debug("Filas totales: %d, Filas con indicadores válidos: %d", len(data), len(display_data))
+            if len(display_data) > 0:
+                self.logger.debug("Primera fila con MAs: %s", display_data.iloc[0].to_dict())
+        
+        # OHLCV primero y luego los indicadores técnicos, en una sola conversión
+        chart_df = display_data.reindex(columns=ohlcv_cols + indicator_cols).astype(np.float64)
+        chart_df.insert(0, 'timestamp', [
+            idx.isoformat() if hasattr(idx, 'isoformat') else str(idx)
+            for idx in display_data.index
+        ])
+        chart_data = chart_df.astype(object).where(chart_df.notna(), None).to_dict(orient='records')
         
         return {
             'initial_capital': float(self.initial_capital),
@@ -222,20 +385,10 @@ class Backtester:
             'max_drawdown': float(max_drawdown) if not np.isnan(max_drawdown) else 0.0,
             'total_trades': int(len(trades)),
             'win_rate': float(win_rate),
-            'trades': trades,
-            'equity_curve': [float(x) for x in equity_curve],
+            'trades': trades.to_list_of_dicts(),
+            'equity_curve': equity_curve.tolist(),
             'chart_data': chart_data  # Nuevos datos para gráfico de velas
         }
-        
-        # Guardar resultados si está habilitado
-        if self.save_results and self.results_logger:
-            symbol = getattr(data, 'symbol', 'UNKNOWN')
-            self.results_logger.save_backtest(
-                strategy_name=self.strategy.name,
-                symbol=symbol,
-                results=metrics,
-                params=self.strategy.params
-            )
     
     def print_results(self):
         """Print backtest results"""
@@ -256,6 +409,16 @@ class Backtester:
         print("="*50 + "\n")
 
 
+def _reset_io_pool_after_fork():
+    """Un hijo creado con fork hereda el pool pero no su hilo: crear otro"""
+    Backtester._io_pool = None
+    Backtester._io_pool_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_io_pool_after_fork)
+
+
 class MultiSymbolBacktester:
     """
     Backtesting engine for multi-symbol strategies (pair trading, arbitrage, etc.)
@@ -289,15 +452,14 @@ class MultiSymbolBacktester:
         self.initial_capital = initial_capital
         self.commission = commission
         self.slippage = slippage
+        # Factores de costo constantes, calculados una sola vez
+        self._buy_factor = 1.0 + commission + slippage
+        self._sell_factor = 1.0 - commission - slippage
         self.results = {}
         self.save_results = save_results
         self.results_logger = ResultsLogger() if save_results else None
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # La configuración de logging queda a cargo del entrypoint (main.py, API)
         self.logger = logging.getLogger(__name__)
     
     def run(
@@ -317,242 +479,180 @@ class MultiSymbolBacktester:
         Returns:
             Dictionary with backtest results
         """
-        self.logger.info(f"Starting multi-symbol backtest for {self.strategy.name}")
-        self.logger.info(f"Symbols: {list(data_dict.keys())}")
+        self.logger.info("Starting multi-symbol backtest for %s", self.strategy.name)
+        self.logger.info("Symbols: %s", list(data_dict.keys()))
         
         # Calculate indicators and generate signals
-        data_dict = self.strategy.calculate_multi_symbol_indicators(data_dict.copy())
+        # Copias superficiales, igual que en Backtester.run: la estrategia
+        # agrega columnas sin tocar los DataFrames del llamador
+        data_dict = self.strategy.calculate_multi_symbol_indicators({
+            symbol: df.copy(deep=False) for symbol, df in data_dict.items()
+        })
         data_dict = self.strategy.generate_multi_symbol_signals(data_dict)
         
-        # Initialize portfolio tracking
-        capital = self.initial_capital
-        positions = {symbol: 0 for symbol in data_dict.keys()}  # shares held per symbol
-        trades = []
-        equity_curve = []
+        symbols = list(data_dict.keys())
         
         # Get aligned timestamps (all dataframes should have same index)
-        timestamps = list(data_dict.values())[0].index
+        timestamps = data_dict[symbols[0]].index
+        
+        # Matrices (barras x símbolos) de close/signal alineadas a timestamps
+        closes = np.empty((len(timestamps), len(symbols)))
+        signals = np.zeros((len(timestamps), len(symbols)))
+        for j, symbol in enumerate(symbols):
+            df = data_dict[symbol]
+            if not df.index.equals(timestamps):
+                df = df.loc[timestamps]
+            closes[:, j] = df['close'].to_numpy(dtype=np.float64)
+            if 'signal' in df.columns:
+                signals[:, j] = df['signal'].to_numpy(dtype=np.float64)
         
         # Simulate trading
-        for timestamp in timestamps:
-            # Get current row for each symbol
-            current_rows = {symbol: df.loc[timestamp] for symbol, df in data_dict.items()}
-            
-            # Process signals for each symbol
-            for symbol, row in current_rows.items():
-                signal = row.get('signal', 0)
-                price = float(row['close'])
-                current_position = positions[symbol]
-                
-                # Buy signal (enter long or exit short)
-                if signal == 1:
-                    if current_position <= 0:  # Flat or short
-                        # Calculate position size (use portion of capital)
-                        # For pair trading: split capital between both symbols
-                        position_capital = capital / len(data_dict)
-                        
-                        # If currently short, first close that position
-                        if current_position < 0:
-                            # Close short: buy back shares
-                            cost = abs(current_position) * price * (1 + self.commission + self.slippage)
-                            capital -= cost
-                            
-                            trades.append({
-                                'symbol': symbol,
-                                'type': 'COVER',
-                                'date': timestamp,
-                                'price': float(price),
-                                'shares': int(abs(current_position)),
-                                'capital': float(capital)
-                            })
-                            positions[symbol] = 0
-                            current_position = 0
-                        
-                        # Open long position
-                        shares = int(position_capital / (price * (1 + self.commission + self.slippage)))
-                        if shares > 0:
-                            cost = shares * price * (1 + self.commission + self.slippage)
-                            capital -= cost
-                            positions[symbol] = shares
-                            
-                            trades.append({
-                                'symbol': symbol,
-                                'type': 'BUY',
-                                'date': timestamp,
-                                'price': float(price),
-                                'shares': int(shares),
-                                'capital': float(capital)
-                            })
-                            self.logger.info(f"BUY {symbol}: {shares} shares at {price}")
-                
-                # Sell signal (enter short or exit long)
-                elif signal == -1:
-                    if current_position >= 0:  # Flat or long
-                        # If currently long, first close that position
-                        if current_position > 0:
-                            # Close long: sell shares
-                            revenue = current_position * price * (1 - self.commission - self.slippage)
-                            capital += revenue
-                            
-                            trades.append({
-                                'symbol': symbol,
-                                'type': 'SELL',
-                                'date': timestamp,
-                                'price': float(price),
-                                'shares': int(current_position),
-                                'capital': float(capital)
-                            })
-                            positions[symbol] = 0
-                            current_position = 0
-                        
-                        # Open short position
-                        position_capital = capital / len(data_dict)
-                        shares = int(position_capital / (price * (1 + self.commission + self.slippage)))
-                        if shares > 0:
-                            # Short: receive money, but have negative position
-                            revenue = shares * price * (1 - self.commission - self.slippage)
-                            capital += revenue
-                            positions[symbol] = -shares
-                            
-                            trades.append({
-                                'symbol': symbol,
-                                'type': 'SHORT',
-                                'date': timestamp,
-                                'price': float(price),
-                                'shares': int(shares),
-                                'capital': float(capital)
-                            })
-                            self.logger.info(f"SHORT {symbol}: {shares} shares at {price}")
-            
-            # Calculate current portfolio equity
-            portfolio_value = capital
-            for symbol, position in positions.items():
-                if position != 0:
-                    current_price = float(current_rows[symbol]['close'])
-                    # Long positions add value, short positions subtract
-                    portfolio_value += position * current_price
-            
-            equity_curve.append(portfolio_value)
+        (
+            equity,
+            trade_idx,
+            trade_symbol,
+            trade_kind,
+            trade_shares,
+            trade_capital,
+            capital,
+            positions
+        ) = simulate_multi(
+            closes,
+            signals,
+            float(self.initial_capital),
+            float(self._buy_factor),
+            float(self._sell_factor)
+        )
         
-        # Close all remaining positions
-        final_timestamp = timestamps[-1]
-        for symbol, position in positions.items():
+        # Close all remaining positions (se agregan como trades al final)
+        closing = []
+        for j, position in enumerate(positions.tolist()):
             if position != 0:
-                final_price = float(data_dict[symbol].loc[final_timestamp]['close'])
+                final_price = float(closes[-1, j])
                 
                 if position > 0:
                     # Close long
-                    revenue = position * final_price * (1 - self.commission - self.slippage)
-                    capital += revenue
-                    trade_type = 'SELL'
+                    capital += position * final_price * self._sell_factor
+                    closing.append((j, TRADE_SELL, position, capital))
                 else:
                     # Close short
-                    cost = abs(position) * final_price * (1 + self.commission + self.slippage)
-                    capital -= cost
-                    trade_type = 'COVER'
-                
-                trades.append({
-                    'symbol': symbol,
-                    'type': trade_type,
-                    'date': final_timestamp,
-                    'price': float(final_price),
-                    'shares': int(abs(position)),
-                    'capital': float(capital)
-                })
-                positions[symbol] = 0
+                    capital -= abs(position) * final_price * self._buy_factor
+                    closing.append((j, TRADE_COVER, abs(position), capital))
+        
+        if closing:
+            close_symbol, close_kind, close_shares, close_capital = zip(*closing)
+            trade_idx = np.append(trade_idx, np.full(len(closing), len(timestamps) - 1))
+            trade_symbol = np.append(trade_symbol, close_symbol)
+            trade_kind = np.append(trade_kind, np.array(close_kind, dtype=np.int8))
+            trade_shares = np.append(trade_shares, close_shares)
+            trade_capital = np.append(trade_capital, close_capital)
+        
+        trades = Trades(
+            types=trade_kind,
+            dates=timestamps[trade_idx],
+            prices=closes[trade_idx, trade_symbol],
+            shares=trade_shares,
+            capitals=trade_capital,
+            symbols=trade_symbol,
+            symbol_names=symbols
+        )
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            for j, kind, shares, price in zip(trades.symbols, trades.types, trades.shares, trades.prices):
+                if kind in (TRADE_BUY, TRADE_SHORT):
+                    self.logger.info(
+                        "%s %s: %d shares at %s",
+                        _TRADE_LABELS[kind], symbols[j], shares, price
+                    )
         
         # Calculate metrics
         self.results = self._calculate_multi_symbol_metrics(
-            equity_curve,
+            equity,
             trades,
             data_dict
         )
         
-        self.logger.info(f"Backtest completed. Final capital: {capital:.2f}")
+        self.logger.info("Backtest completed. Final capital: %.2f", capital)
         return self.results
     
     def _calculate_multi_symbol_metrics(
         self,
-        equity_curve: List[float],
-        trades: List[Dict],
+        equity_curve: np.ndarray,
+        trades: Trades,
         data_dict: Dict[str, pd.DataFrame]
     ) -> Dict[str, Any]:
         """
         Calculate performance metrics for multi-symbol portfolio.
         
         Args:
-            equity_curve: List of portfolio equity values
-            trades: List of all trades across all symbols
+            equity_curve: Array of portfolio equity values
+            trades: Columnar trades across all symbols
             data_dict: Dictionary of symbol -> DataFrame
             
         Returns:
             Dictionary with performance metrics
         """
-        final_capital = equity_curve[-1] if equity_curve else self.initial_capital
+        equity_curve = np.asarray(equity_curve, dtype=np.float64)
+        final_capital = equity_curve[-1] if len(equity_curve) else self.initial_capital
         total_return = (final_capital - self.initial_capital) / self.initial_capital * 100
         
-        # Calculate returns
-        returns = pd.Series(equity_curve).pct_change().dropna()
-        
-        # Sharpe ratio (annualized)
-        sharpe_ratio = 0
-        if len(returns) > 0 and returns.std() != 0:
-            sharpe_ratio = np.sqrt(252) * (returns.mean() / returns.std())
-        
-        # Maximum drawdown
-        equity_series = pd.Series(equity_curve)
-        running_max = equity_series.expanding().max()
-        drawdown = (equity_series - running_max) / running_max
-        max_drawdown = drawdown.min() * 100
-        
-        # Trade statistics by symbol
-        trades_by_symbol = {}
-        for trade in trades:
-            symbol = trade['symbol']
-            if symbol not in trades_by_symbol:
-                trades_by_symbol[symbol] = []
-            trades_by_symbol[symbol].append(trade)
-        
-        # Overall win rate (calculated from complete round trips)
-        winning_trades = 0
-        total_trade_pairs = 0
-        
-        for symbol, symbol_trades in trades_by_symbol.items():
-            # Pair up buy/sell trades
-            for i in range(0, len(symbol_trades) - 1, 2):
-                if i + 1 < len(symbol_trades):
-                    entry_trade = symbol_trades[i]
-                    exit_trade = symbol_trades[i + 1]
-                    
-                    # Determine if profitable
-                    if entry_trade['type'] in ['BUY', 'SHORT']:
-                        if exit_trade['capital'] > entry_trade['capital']:
-                            winning_trades += 1
-                        total_trade_pairs += 1
+        # Sharpe ratio (annualized) y maximum drawdown en una sola pasada
+        sharpe_ratio, max_drawdown = equity_metrics(equity_curve)
+        
+        # Trade statistics by symbol, a partir de los arrays de la simulación
+        symbol_codes = trades.symbols
+        trade_counts = np.bincount(symbol_codes, minlength=len(trades.symbol_names))
+        # Orden de primera aparición, como al agrupar los trades en un dict
+        traded, first_seen = np.unique(symbol_codes, return_index=True)
+        trades_by_symbol = {
+            trades.symbol_names[code]: int(trade_counts[code])
+            for code in traded[np.argsort(first_seen)].tolist()
+        }
+        
+        # Overall win rate (calculated from complete round trips): por símbolo,
+        # los trades se emparejan (0, 1), (2, 3)... en orden cronológico
+        order = np.argsort(symbol_codes, kind='stable')
+        grouped_symbols = symbol_codes[order]
+        group_start = np.flatnonzero(np.r_[True, grouped_symbols[1:] != grouped_symbols[:-1]])
+        group_sizes = np.diff(np.r_[group_start, len(order)])
+        rank = np.arange(len(order)) - np.repeat(group_start, group_sizes)
+        has_exit = np.zeros(len(order), dtype=bool)
+        has_exit[:-1] = grouped_symbols[1:] == grouped_symbols[:-1]
+        entries = order[(rank % 2 == 0) & has_exit]
+        exits = order[np.flatnonzero((rank % 2 == 0) & has_exit) + 1]
+        
+        is_pair = np.isin(trades.types[entries], (TRADE_BUY, TRADE_SHORT))
+        total_trade_pairs = int(np.count_nonzero(is_pair))
+        winning_trades = int(np.count_nonzero(
+            is_pair & (trades.capitals[exits] > trades.capitals[entries])
+        ))
         
         win_rate = (winning_trades / total_trade_pairs * 100) if total_trade_pairs > 0 else 0
         
         # Prepare chart data (use first symbol's data with spread indicator if available)
-        chart_data = []
         primary_symbol = list(data_dict.keys())[0]
         primary_data = data_dict[primary_symbol]
         
-        # For pair trading, include spread in chart data
-        for idx, row in primary_data.iterrows():
-            point = {
+        # Columnas convertidas en bloque; NaN en close pasa a None
+        closes = primary_data['close'].to_numpy(dtype=np.float64)
+        chart_data = [
+            {
                 'timestamp': idx.isoformat() if hasattr(idx, 'isoformat') else str(idx),
-                'close': float(row['close']) if not pd.isna(row['close']) else None,
+                'close': close
             }
-            
-            # Add spread and z-score if available (for pair trading)
-            if 'spread' in row and not pd.isna(row['spread']):
-                point['spread'] = float(row['spread'])
-            if 'z_score' in row and not pd.isna(row['z_score']):
-                point['z_score'] = float(row['z_score'])
-            if 'spread_mean' in row and not pd.isna(row['spread_mean']):
-                point['spread_mean'] = float(row['spread_mean'])
-            
-            chart_data.append(point)
+            for idx, close in zip(
+                primary_data.index,
+                np.where(np.isnan(closes), None, closes).tolist()
+            )
+        ]
+        
+        # For pair trading, include spread and z-score where available
+        for col in ['spread', 'z_score', 'spread_mean']:
+            if col in primary_data.columns:
+                values = primary_data[col].to_numpy(dtype=np.float64)
+                valid = ~np.isnan(values)
+                for point, value in zip(compress(chart_data, valid), values[valid].tolist()):
+                    point[col] = value
         
         return {
             'initial_capital': float(self.initial_capital),
@@ -562,9 +662,9 @@ class MultiSymbolBacktester:
             'max_drawdown': float(max_drawdown) if not np.isnan(max_drawdown) else 0.0,
             'total_trades': int(len(trades)),
             'win_rate': float(win_rate),
-            'trades': trades,
-            'trades_by_symbol': {sym: len(trades) for sym, trades in trades_by_symbol.items()},
-            'equity_curve': [float(x) for x in equity_curve],
+            'trades': trades.to_list_of_dicts(),
+            'trades_by_symbol': trades_by_symbol,
+            'equity_curve': equity_curve.tolist(),
             'chart_data': chart_data,
             'symbols': list(data_dict.keys())
         }
@@ -2,7 +2,13 @@
 Comparador de Estrategias
 Ejecuta todas las estrategias y compara resultados
 """
+import os
+import sys
+import argparse
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
 from datetime import datetime, timedelta
 
 from strategies.ma_crossover import MovingAverageCrossover
@@ -14,33 +20,136 @@ from strategies.multi_indicator import MultiIndicatorStrategy
 from backtesting.backtester import Backtester
 from utils.data_fetcher import DataFetcher
 
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
 
-def generate_sample_data(days=365):
-    """Genera datos de muestra para testing"""
-    import numpy as np
+
+def generate_sample_data(days=365, seed=None, dtype='float32'):
+    """
+    Genera datos de muestra para testing (seed opcional para reproducir)
+    
+    Los precios se generan en float32 por defecto: la mitad de memoria y
+    suficiente precisión para las señales (los indicadores se calculan en
+    float64 y el capital del Backtester sigue en float64).
+    """
     dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
     
+    # Todo el ruido en un solo bloque (días x 4) de un único generador
+    rng = np.random.default_rng(seed)
+    noise = rng.standard_normal((days, 4), dtype=dtype)
+    
     base_price = 100
-    trend = np.linspace(0, 50, days)
-    noise = np.random.randn(days) * 5
-    close = base_price + trend + noise
+    trend = np.linspace(0, 50, days, dtype=dtype)
+    close = base_price + trend + 5 * noise[:, 0]
+    open_ = close + 2 * noise[:, 1]
+    high = close + 3 * np.abs(noise[:, 2])
+    low = close - 3 * np.abs(noise[:, 3])
+    
+    # El máximo/mínimo de la barra incluye apertura y cierre
+    high = np.maximum.reduce([open_, high, close])
+    low = np.minimum.reduce([open_, low, close])
     
     data = pd.DataFrame({
-        'open': close + np.random.randn(days) * 2,
-        'high': close + abs(np.random.randn(days) * 3),
-        'low': close - abs(np.random.randn(days) * 3),
+        'open': open_,
+        'high': high,
+        'low': low,
         'close': close,
-        'volume': np.random.randint(1000, 10000, days)
+        'volume': rng.integers(1000, 10000, days).astype(dtype)
     }, index=dates)
     
-    data['high'] = data[['open', 'high', 'close']].max(axis=1)
-    data['low'] = data[['open', 'low', 'close']].min(axis=1)
-    
     return data
 
 
-def compare_strategies():
-    """Compara todas las estrategias disponibles"""
+# Columnas numéricas de la tabla comparativa -> clave en los resultados del
+# Backtester (la tabla se arma por columnas, no fila por fila)
+RESULT_COLUMNS = (
+    ('Retorno (%)', 'total_return'),
+    ('Capital Final', 'final_capital'),
+    ('Sharpe Ratio', 'sharpe_ratio'),
+    ('Max Drawdown (%)', 'max_drawdown'),
+    ('Total Trades', 'total_trades'),
+    ('Win Rate (%)', 'win_rate'),
+)
+
+# DataFrame de mercado de cada worker, armado sobre la memoria compartida
+_shared_data = None
+_shared_block = None
+
+
+def _share_data(data):
+    """
+    Copiar los datos OHLCV a un bloque de memoria compartida
+    
+    El bloque es (columnas x barras) para que cada columna quede contigua.
+    Los workers lo leen sin copiarlo, en vez de recibir el DataFrame
+    serializado en cada tarea.
+    
+    Returns:
+        Tupla (SharedMemory, spec para _attach_shared_data)
+    """
+    dtype = np.result_type(*data.dtypes)
+    shape = (len(data.columns), len(data))
+    shm = shared_memory.SharedMemory(
+        create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize)
+    )
+    block = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    for j, column in enumerate(data.columns):
+        block[j] = data[column].to_numpy(dtype=dtype)
+    
+    spec = (shm.name, shape, dtype.str, list(data.columns), data.index)
+    return shm, spec
+
+
+def _attach_shared_data(spec):
+    """Initializer de los workers: reconstruir el DataFrame sin copiar"""
+    global _shared_data, _shared_block
+    name, shape, dtype, columns, index = spec
+    _shared_block = shared_memory.SharedMemory(name=name)
+    block = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_shared_block.buf)
+    block.flags.writeable = False
+    _shared_data = pd.DataFrame(block.T, index=index, columns=columns, copy=False)
+
+
+def _run_one(strategy, data=None):
+    """
+    Ejecutar el backtest de una estrategia (función top-level para poder
+    enviarla a otro proceso)
+    
+    Args:
+        strategy: Estrategia a evaluar
+        data: Datos OHLCV; None usa los de la memoria compartida del worker
+    
+    Returns:
+        Tupla (valores en el orden de RESULT_COLUMNS, None) o
+        (None, mensaje de error) si el backtest falla
+    """
+    if data is None:
+        data = _shared_data
+    
+    backtester = Backtester(
+        strategy=strategy,
+        initial_capital=10000.0,
+        commission=0.001
+    )
+    
+    try:
+        # Backtester.run no modifica `data` (trabaja sobre una copia superficial)
+        result = backtester.run(data)
+        return tuple(result[key] for _, key in RESULT_COLUMNS), None
+    
+    except Exception as e:
+        return None, str(e)
+
+
+def compare_strategies(save_csv=False):
+    """
+    Compara todas las estrategias disponibles
+    
+    Args:
+        save_csv: Si True, guarda la tabla en CSV (legible) en vez de Feather
+    """
     
     print("=" * 80)
     print("COMPARACIÓN DE ESTRATEGIAS DE TRADING")
@@ -62,114 +171,146 @@ def compare_strategies():
         MultiIndicatorStrategy(params={})
     ]
     
-    # Ejecutar backtests
-    results = []
+    # Ejecutar backtests: son independientes, uno por proceso. Resultados
+    # por columna; NaN para las estrategias que fallan (no cuentan como 0%
+    # al elegir las mejores)
+    results = {'Estrategia': [strategy.name for strategy in strategies]}
+    for column, _ in RESULT_COLUMNS:
+        results[column] = np.full(len(strategies), np.nan)
+    errors = [None] * len(strategies)
     
     print("Ejecutando backtests...")
     print("-" * 80)
     
-    for strategy in strategies:
-        print(f"\n📊 Testing: {strategy.name}...")
-        
-        backtester = Backtester(
-            strategy=strategy,
-            initial_capital=10000.0,
-            commission=0.001
-        )
-        
-        try:
-            result = backtester.run(data.copy())
-            results.append({
-                'Estrategia': strategy.name,
-                'Retorno (%)': result['total_return'],
-                'Capital Final': result['final_capital'],
-                'Sharpe Ratio': result['sharpe_ratio'],
-                'Max Drawdown (%)': result['max_drawdown'],
-                'Total Trades': result['total_trades'],
-                'Win Rate (%)': result['win_rate']
-            })
-            print(f"   ✓ Completado: {result['total_return']:.2f}% retorno")
-        
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
-            results.append({
-                'Estrategia': strategy.name,
-                'Retorno (%)': 0,
-                'Capital Final': 10000,
-                'Sharpe Ratio': 0,
-                'Max Drawdown (%)': 0,
-                'Total Trades': 0,
-                'Win Rate (%)': 0
-            })
+    # Los datos se copian una vez a memoria compartida; cada worker los
+    # adjunta al arrancar y las tareas solo envían la estrategia
+    shm, spec = _share_data(data)
+    max_workers = min(len(strategies), os.cpu_count() or 1)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_attach_shared_data,
+            initargs=(spec,)
+        ) as executor:
+            futures = {
+                executor.submit(_run_one, strategy): i
+                for i, strategy in enumerate(strategies)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                values, errors[i] = future.result()
+                
+                if errors[i] is None:
+                    # Fila i: mantiene el orden original de las estrategias
+                    for (column, _), value in zip(RESULT_COLUMNS, values):
+                        results[column][i] = value
+    finally:
+        shm.close()
+        shm.unlink()
+    
+    # El informe se arma en memoria y se escribe de una vez al final, con
+    # las estrategias en su orden original (no en el orden en que terminan)
+    report = []
+    
+    for i, strategy in enumerate(strategies):
+        report.append(f"\n📊 Testing: {strategy.name}...")
+        if errors[i] is None:
+            report.append(f"   ✓ Completado: {results['Retorno (%)'][i]:.2f}% retorno")
+        else:
+            report.append(f"   ✗ Error: {errors[i]}")
     
     # Crear tabla de resultados
-    print("\n" + "=" * 80)
-    print("RESULTADOS COMPARATIVOS")
-    print("=" * 80)
-    print()
+    report.append("\n" + "=" * 80)
+    report.append("RESULTADOS COMPARATIVOS")
+    report.append("=" * 80)
+    report.append("")
     
     df_results = pd.DataFrame(results)
+    df_results['Total Trades'] = df_results['Total Trades'].astype('Int64')
     df_results = df_results.sort_values('Retorno (%)', ascending=False)
     
     # Formatear tabla
-    print(df_results.to_string(index=False))
-    print()
+    report.append(df_results.to_string(index=False))
+    report.append("")
     
     # Análisis y recomendaciones
-    print("=" * 80)
-    print("ANÁLISIS Y RECOMENDACIONES")
-    print("=" * 80)
-    print()
+    report.append("=" * 80)
+    report.append("ANÁLISIS Y RECOMENDACIONES")
+    report.append("=" * 80)
+    report.append("")
+    
+    if df_results['Retorno (%)'].isna().all():
+        report.append("   ✗ Ninguna estrategia completó el backtest")
+        sys.stdout.write("\n".join(report) + "\n")
+        return
     
+    # Las filas con NaN (fallidas) quedan al final y idxmax las ignora
     best_return = df_results.iloc[0]
     best_sharpe = df_results.loc[df_results['Sharpe Ratio'].idxmax()]
     best_winrate = df_results.loc[df_results['Win Rate (%)'].idxmax()]
     lowest_drawdown = df_results.loc[df_results['Max Drawdown (%)'].idxmax()]  # Menos negativo
     
-    print(f"🏆 MEJOR RETORNO:")
-    print(f"   {best_return['Estrategia']}: {best_return['Retorno (%)']:.2f}%")
-    print()
+    report.append(f"🏆 MEJOR RETORNO:")
+    report.append(f"   {best_return['Estrategia']}: {best_return['Retorno (%)']:.2f}%")
+    report.append("")
     
-    print(f"📊 MEJOR SHARPE RATIO (Riesgo/Beneficio):")
-    print(f"   {best_sharpe['Estrategia']}: {best_sharpe['Sharpe Ratio']:.2f}")
-    print()
+    report.append(f"📊 MEJOR SHARPE RATIO (Riesgo/Beneficio):")
+    report.append(f"   {best_sharpe['Estrategia']}: {best_sharpe['Sharpe Ratio']:.2f}")
+    report.append("")
     
-    print(f"🎯 MEJOR WIN RATE:")
-    print(f"   {best_winrate['Estrategia']}: {best_winrate['Win Rate (%)']:.2f}%")
-    print()
+    report.append(f"🎯 MEJOR WIN RATE:")
+    report.append(f"   {best_winrate['Estrategia']}: {best_winrate['Win Rate (%)']:.2f}%")
+    report.append("")
     
-    print(f"🛡️  MENOR DRAWDOWN (Más segura):")
-    print(f"   {lowest_drawdown['Estrategia']}: {lowest_drawdown['Max Drawdown (%)']:.2f}%")
-    print()
+    report.append(f"🛡️  MENOR DRAWDOWN (Más segura):")
+    report.append(f"   {lowest_drawdown['Estrategia']}: {lowest_drawdown['Max Drawdown (%)']:.2f}%")
+    report.append("")
     
-    print("💡 RECOMENDACIONES:")
-    print()
+    report.append("💡 RECOMENDACIONES:")
+    report.append("")
     
     # Recomendación basada en perfil
     if best_sharpe['Sharpe Ratio'] > 1.0:
-        print("   ✓ Para traders conservadores:")
-        print(f"     → {best_sharpe['Estrategia']} (Mejor Sharpe: {best_sharpe['Sharpe Ratio']:.2f})")
+        report.append("   ✓ Para traders conservadores:")
+        report.append(f"     → {best_sharpe['Estrategia']} (Mejor Sharpe: {best_sharpe['Sharpe Ratio']:.2f})")
     
     if best_return['Retorno (%)'] > 20:
-        print("   ✓ Para traders agresivos:")
-        print(f"     → {best_return['Estrategia']} (Retorno: {best_return['Retorno (%)']:.2f}%)")
+        report.append("   ✓ Para traders agresivos:")
+        report.append(f"     → {best_return['Estrategia']} (Retorno: {best_return['Retorno (%)']:.2f}%)")
     
     if best_winrate['Win Rate (%)'] > 60:
-        print("   ✓ Para traders que buscan consistencia:")
-        print(f"     → {best_winrate['Estrategia']} (Win Rate: {best_winrate['Win Rate (%)']:.2f}%)")
+        report.append("   ✓ Para traders que buscan consistencia:")
+        report.append(f"     → {best_winrate['Estrategia']} (Win Rate: {best_winrate['Win Rate (%)']:.2f}%)")
     
-    print()
-    print("⚠️  NOTA IMPORTANTE:")
-    print("   Estos resultados son con datos SINTÉTICOS.")
-    print("   Prueba con datos REALES usando:")
-    print("   python3 main.py --strategy NOMBRE --symbol BTC/USDT --days 365")
-    print()
+    report.append("")
+    report.append("⚠️  NOTA IMPORTANTE:")
+    report.append("   Estos resultados son con datos SINTÉTICOS.")
+    report.append("   Prueba con datos REALES usando:")
+    report.append("   python3 main.py --strategy NOMBRE --symbol BTC/USDT --days 365")
+    report.append("")
     
     # Guardar resultados
-    df_results.to_csv('data/strategy_comparison.csv', index=False)
-    print(f"✓ Resultados guardados en: data/strategy_comparison.csv")
-    print()
+    # Feather (Arrow) escribe columnas binarias sin formatear floats; el CSV
+    # queda para lectura humana o cuando pyarrow no está instalado
+    if save_csv or feather is None:
+        output_path = 'data/strategy_comparison.csv'
+        df_results.to_csv(output_path, index=False)
+    else:
+        output_path = 'data/strategy_comparison.feather'
+        feather.write_feather(df_results.reset_index(drop=True), output_path)
+    report.append(f"✓ Resultados guardados en: {output_path}")
+    report.append("")
+    
+    sys.stdout.write("\n".join(report) + "\n")
 
 
 if __name__ == '__main__':
-    compare_strategies()
+    parser = argparse.ArgumentParser(description='Comparar estrategias de trading')
+    parser.add_argument(
+        '--csv',
+        action='store_true',
+        help='Guardar resultados en CSV en vez de Feather'
+    )
+    args = parser.parse_args()
+    
+    compare_strategies(save_csv=args.csv)
@@ -10,26 +10,28 @@ from strategies.bollinger_bands import BollingerBandsStrategy
 from strategies.mean_reversion import MeanReversionStrategy
 from strategies.multi_indicator import MultiIndicatorStrategy
 
+# Acción según la señal de la estrategia
+ACTIONS = {1: "COMPRAR", -1: "VENDER", 0: "ESPERAR"}
 
-def create_scenario_data():
-    """Crea datos con escenarios específicos"""
+
+def create_scenario_data(seed=None):
+    """Crea datos con escenarios específicos (seed opcional para reproducir)"""
     dates = pd.date_range('2024-01-01', periods=100, freq='D')
+    rng = np.random.default_rng(seed)
     
-    # Escenario: Precio lateral con picos
-    base = 100
-    lateral = np.ones(50) * base
-    spike_up = np.linspace(100, 120, 25)  # Pico hacia arriba
-    spike_down = np.linspace(120, 95, 25)  # Caída
-    
-    prices = np.concatenate([lateral, spike_up, spike_down])
-    prices += np.random.randn(100) * 2  # Ruido
+    # Escenario: Precio lateral con picos, escrito por tramos en un solo buffer
+    prices = np.empty(100, dtype=np.float32)
+    prices[:50] = 100.0                          # Lateral
+    prices[50:75] = np.linspace(100, 120, 25)    # Pico hacia arriba
+    prices[75:] = np.linspace(120, 95, 25)       # Caída
+    prices += rng.standard_normal(100, dtype=np.float32) * 2  # Ruido
     
     data = pd.DataFrame({
         'open': prices,
         'high': prices + 2,
         'low': prices - 2,
         'close': prices,
-        'volume': np.random.randint(1000, 3000, 100)
+        'volume': rng.integers(1000, 3000, 100)
     }, index=dates)
     
     return data
@@ -51,10 +53,11 @@ def compare_decisions():
     mean_rev = MeanReversionStrategy()
     multi = MultiIndicatorStrategy()
     
-    # Calcular indicadores y señales para cada una
-    data_bb = bollinger.generate_signals(bollinger.calculate_indicators(data.copy()))
-    data_mr = mean_rev.generate_signals(mean_rev.calculate_indicators(data.copy()))
-    data_mi = multi.generate_signals(multi.calculate_indicators(data.copy()))
+    # Calcular indicadores y señales para cada una (las estrategias solo
+    # agregan columnas: alcanza con una copia superficial)
+    data_bb = bollinger.generate_signals(bollinger.calculate_indicators(data.copy(deep=False)))
+    data_mr = mean_rev.generate_signals(mean_rev.calculate_indicators(data.copy(deep=False)))
+    data_mi = multi.generate_signals(multi.calculate_indicators(data.copy(deep=False)))
     
     # Momentos clave para analizar
     key_moments = [
@@ -63,6 +66,17 @@ def compare_decisions():
         (90, "Precio cayendo a $95 (mínimo)")
     ]
     
+    # Columnas como arrays NumPy: lecturas escalares por posición, sin
+    # crear una Serie por fila en cada consulta
+    close = data['close'].to_numpy()
+    bb_sig = data_bb['signal'].to_numpy()
+    bb_up = data_bb['bb_upper'].to_numpy()
+    bb_low = data_bb['bb_lower'].to_numpy()
+    mr_sig = data_mr['signal'].to_numpy()
+    mr_z = data_mr['z_score'].to_numpy()
+    mi_sig = data_mi['signal'].to_numpy()
+    mi_rsi = data_mi['rsi'].to_numpy()
+    
     print("-" * 80)
     print("ANÁLISIS DE MOMENTOS CLAVE")
     print("-" * 80)
@@ -72,30 +86,21 @@ def compare_decisions():
             continue
             
         print(f"\n📅 DÍA {idx}: {description}")
-        print(f"   Precio: ${data.iloc[idx]['close']:.2f}")
+        print(f"   Precio: ${close[idx]:.2f}")
         print()
         
         # Bollinger Bands
-        bb_signal = data_bb.iloc[idx]['signal']
-        bb_action = "COMPRAR" if bb_signal == 1 else ("VENDER" if bb_signal == -1 else "ESPERAR")
-        print(f"   🔵 Bollinger Bands: {bb_action}")
-        if hasattr(data_bb.iloc[idx], 'bb_upper'):
-            print(f"      Banda Superior: ${data_bb.iloc[idx]['bb_upper']:.2f}")
-            print(f"      Banda Inferior: ${data_bb.iloc[idx]['bb_lower']:.2f}")
+        print(f"   🔵 Bollinger Bands: {ACTIONS[bb_sig[idx]]}")
+        print(f"      Banda Superior: ${bb_up[idx]:.2f}")
+        print(f"      Banda Inferior: ${bb_low[idx]:.2f}")
         
         # Mean Reversion
-        mr_signal = data_mr.iloc[idx]['signal']
-        mr_action = "COMPRAR" if mr_signal == 1 else ("VENDER" if mr_signal == -1 else "ESPERAR")
-        print(f"   🟢 Mean Reversion: {mr_action}")
-        if 'z_score' in data_mr.columns:
-            print(f"      Z-Score: {data_mr.iloc[idx]['z_score']:.2f}")
+        print(f"   🟢 Mean Reversion: {ACTIONS[mr_sig[idx]]}")
+        print(f"      Z-Score: {mr_z[idx]:.2f}")
         
         # Multi-Indicator
-        mi_signal = data_mi.iloc[idx]['signal']
-        mi_action = "COMPRAR" if mi_signal == 1 else ("VENDER" if mi_signal == -1 else "ESPERAR")
-        print(f"   🔴 Multi-Indicator: {mi_action}")
-        if 'rsi' in data_mi.columns:
-            print(f"      RSI: {data_mi.iloc[idx]['rsi']:.2f}")
+        print(f"   🔴 Multi-Indicator: {ACTIONS[mi_sig[idx]]}")
+        print(f"      RSI: {mi_rsi[idx]:.2f}")
         
         print()
     
@@ -105,9 +110,9 @@ def compare_decisions():
     print("-" * 80)
     print()
     
-    bb_trades = len(data_bb[data_bb['signal'] != 0])
-    mr_trades = len(data_mr[data_mr['signal'] != 0])
-    mi_trades = len(data_mi[data_mi['signal'] != 0])
+    bb_trades = np.count_nonzero(bb_sig)
+    mr_trades = np.count_nonzero(mr_sig)
+    mi_trades = np.count_nonzero(mi_sig)
     
     print(f"📊 Número de señales generadas:")
     print(f"   Bollinger Bands:   {bb_trades} señales")
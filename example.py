@@ -11,31 +11,41 @@ from strategies.ma_crossover import MovingAverageCrossover
 from backtesting.backtester import Backtester
 
 
-def generate_sample_data(days=365):
+def generate_sample_data(days=365, seed=None, dtype='float32'):
     """
     Generate sample OHLCV data for testing
     This is useful when you don't have access to real market data yet
+    (pass a seed to get reproducible data)
+    
+    Prices are float32 by default: half the memory and enough precision for
+    signals (indicators and capital are still computed in float64).
     """
     dates = pd.date_range(end=datetime.now(), periods=days, freq='D')
     
+    # Draw all the noise as one (days x 4) block from a single generator
+    rng = np.random.default_rng(seed)
+    noise = rng.standard_normal((days, 4), dtype=dtype)
+    
     # Generate synthetic price data with trend and noise
     base_price = 100
-    trend = np.linspace(0, 50, days)
-    noise = np.random.randn(days) * 5
-    close = base_price + trend + noise
+    trend = np.linspace(0, 50, days, dtype=dtype)
+    close = base_price + trend + 5 * noise[:, 0]
+    open_ = close + 2 * noise[:, 1]
+    high = close + 3 * np.abs(noise[:, 2])
+    low = close - 3 * np.abs(noise[:, 3])
+    
+    # Ensure high is highest and low is lowest
+    high = np.maximum.reduce([open_, high, close])
+    low = np.minimum.reduce([open_, low, close])
     
     data = pd.DataFrame({
-        'open': close + np.random.randn(days) * 2,
-        'high': close + abs(np.random.randn(days) * 3),
-        'low': close - abs(np.random.randn(days) * 3),
+        'open': open_,
+        'high': high,
+        'low': low,
         'close': close,
-        'volume': np.random.randint(1000, 10000, days)
+        'volume': rng.integers(1000, 10000, days).astype(dtype)
     }, index=dates)
     
-    # Ensure high is highest and low is lowest
-    data['high'] = data[['open', 'high', 'close']].max(axis=1)
-    data['low'] = data[['open', 'low', 'close']].min(axis=1)
-    
     return data
 
 
@@ -84,8 +94,8 @@ def main():
     
     # Show sample of data with signals
     print("\n6. Sample of trading signals:")
-    # Get the data with signals from the backtester
-    signals_df = strategy.generate_signals(strategy.calculate_indicators(data.copy()))
+    # Reuse the data with signals from the backtest instead of recomputing
+    signals_df = backtester.data_with_signals
     signals = signals_df[signals_df['signal'] != 0][['close', 'signal']].head(10)
     if len(signals) > 0:
         print(signals)
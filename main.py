@@ -74,9 +74,9 @@ def main():
     logger = logging.getLogger(__name__)
     
     logger.info("Starting algorithmic trading system")
-    logger.info(f"Strategy: {args.strategy}")
-    logger.info(f"Symbol: {args.symbol}")
-    logger.info(f"Timeframe: {args.timeframe}")
+    logger.info("Strategy: %s", args.strategy)
+    logger.info("Symbol: %s", args.symbol)
+    logger.info("Timeframe: %s", args.timeframe)
     
     # Initialize strategy
     if args.strategy == 'ma_crossover':
@@ -96,7 +96,7 @@ def main():
             params={'period': 20, 'std_dev': 2.0}
         )
     else:
-        logger.error(f"Unknown strategy: {args.strategy}")
+        logger.error("Unknown strategy: %s", args.strategy)
         return
     
     # Fetch data
@@ -120,7 +120,7 @@ def main():
             logger.error("No data fetched")
             return
         
-        logger.info(f"Fetched {len(data)} candles")
+        logger.info("Fetched %d candles", len(data))
         
         # Run backtest
         logger.info("Running backtest...")
@@ -141,7 +141,7 @@ def main():
         logger.info("Done!")
         
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
 
 
 if __name__ == '__main__':
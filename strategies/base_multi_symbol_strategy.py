@@ -7,6 +7,7 @@ Used for strategies like pair trading, statistical arbitrage, and basket trading
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
 import pandas as pd
 from strategies.base_strategy import BaseStrategy
 
@@ -22,6 +23,8 @@ class MultiSymbolStrategy(BaseStrategy):
     - Track portfolio-level metrics
     """
     
+    __slots__ = ('symbols', 'symbol_index', 'symbol_positions')
+    
     def __init__(self, name: str, symbols: List[str], params: Optional[Dict[str, Any]] = None):
         """
         Initialize multi-symbol strategy.
@@ -33,7 +36,15 @@ class MultiSymbolStrategy(BaseStrategy):
         """
         super().__init__(name=name, params=params)
         self.symbols = symbols
-        self.positions_by_symbol = {symbol: 0 for symbol in symbols}
+        # Posiciones como array (una entrada por símbolo, en el orden de
+        # `symbols`) para que los conteos sean vectorizados en canastas grandes
+        self.symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+        self.symbol_positions = np.zeros(len(symbols), dtype=np.int64)
+    
+    @property
+    def positions_by_symbol(self) -> Dict[str, int]:
+        """Current position per symbol (built on demand from symbol_positions)."""
+        return dict(zip(self.symbols, self.symbol_positions.tolist()))
         
     @abstractmethod
     def fetch_multi_symbol_data(
@@ -110,6 +121,42 @@ class MultiSymbolStrategy(BaseStrategy):
             "Multi-symbol strategies should use generate_multi_symbol_signals()"
         )
     
+    @staticmethod
+    def to_panel(data_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Combine per-symbol DataFrames into one wide (symbol, field) frame.
+        
+        Columns are a MultiIndex (symbol, field) and rows are the timestamps
+        common to all symbols. Cross-asset calculations can then work on a
+        (bars x symbols) matrix, e.g.
+        `panel.xs('close', axis=1, level=1).to_numpy()`.
+        
+        Args:
+            data_dict: Dictionary of symbol -> DataFrame
+            
+        Returns:
+            DataFrame with MultiIndex columns (symbol, field)
+        """
+        return pd.concat(data_dict, axis=1, join='inner')
+    
+    @staticmethod
+    def panel_to_dict(panel: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Split a (symbol, field) panel back into symbol -> DataFrame.
+        
+        Compatibility shim for code that expects the dict layout.
+        
+        Args:
+            panel: DataFrame with MultiIndex columns (symbol, field)
+            
+        Returns:
+            Dictionary of symbol -> DataFrame
+        """
+        return {
+            symbol: panel[symbol]
+            for symbol in panel.columns.get_level_values(0).unique()
+        }
+    
     def get_position_summary(self) -> Dict[str, Any]:
         """
         Get current portfolio position summary.
@@ -119,8 +166,8 @@ class MultiSymbolStrategy(BaseStrategy):
         """
         return {
             'symbols': self.symbols,
-            'positions': self.positions_by_symbol.copy(),
-            'num_positions': sum(1 for pos in self.positions_by_symbol.values() if pos != 0)
+            'positions': self.positions_by_symbol,
+            'num_positions': int(np.count_nonzero(self.symbol_positions))
         }
     
     def validate_params(self) -> bool:
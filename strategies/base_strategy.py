@@ -3,7 +3,7 @@ Base Strategy Class
 All trading strategies should inherit from this class
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import pandas as pd
 
 
@@ -12,6 +12,13 @@ class BaseStrategy(ABC):
     Abstract base class for all trading strategies
     """
     
+    # Sin __dict__ por instancia: menos memoria en barridos de parámetros.
+    # Las subclases declaran sus propios atributos (o __slots__ = ())
+    __slots__ = ('name', 'params', 'positions', 'trades')
+    
+    # Columnas que agrega calculate_indicators (None = inferirlas del DataFrame)
+    indicator_columns: Optional[Tuple[str, ...]] = None
+    
     def __init__(self, name: str, params: Optional[Dict[str, Any]] = None):
         """
         Initialize the strategy
@@ -43,6 +50,10 @@ class BaseStrategy(ABC):
         """
         Calculate technical indicators
         
+        Implementations only add columns and never modify the OHLCV ones,
+        so callers can pass `data.copy(deep=False)` (as Backtester does)
+        instead of a deep copy.
+        
         Args:
             data: DataFrame with OHLCV data
             
@@ -57,9 +68,28 @@ class BaseStrategy(ABC):
         
         Returns:
             True if parameters are valid
+        
+        Raises:
+            ValueError: If a parameter is out of range (fail fast instead of
+                returning False and producing NaN indicators later)
         """
         return True
     
+    def cache_key(self) -> Tuple:
+        """
+        Hashable key identifying the strategy output for a given dataset
+        
+        Used to reuse indicators/signals across backtests. Strategies whose
+        output depends on state outside `params` must override this.
+        
+        Returns:
+            Tuple with the strategy class and its parameters
+        """
+        return (
+            type(self).__qualname__,
+            tuple(sorted((key, repr(value)) for key, value in self.params.items()))
+        )
+    
     def get_info(self) -> Dict[str, Any]:
         """
         Get strategy information
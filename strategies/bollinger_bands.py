@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import rolling_mean, rolling_std
 
 
 class BollingerBandsStrategy(BaseStrategy):
@@ -23,6 +24,11 @@ class BollingerBandsStrategy(BaseStrategy):
     - Vende cuando el precio toca o cruza la banda superior
     """
     
+    __slots__ = ()
+    
+    # Columnas agregadas por calculate_indicators
+    indicator_columns = ('bb_middle', 'bb_upper', 'bb_lower', 'bb_width')
+    
     def __init__(self, params: Dict[str, Any] = None):
         default_params = {
             'period': 20,      # Período de la media móvil
@@ -38,50 +44,57 @@ class BollingerBandsStrategy(BaseStrategy):
         period = self.params['period']
         std_multiplier = self.params['std_dev']
         
-        # Media móvil (banda media)
-        data['bb_middle'] = data['close'].rolling(window=period).mean()
+        # Media móvil (banda media) y desviación estándar, O(N) con bottleneck
+        middle = rolling_mean(data['close'], period).to_numpy()
+        std = rolling_std(data['close'], period).to_numpy()
         
-        # Desviación estándar
-        std = data['close'].rolling(window=period).std()
+        # Banda superior e inferior (aritmética sobre arrays, sin alinear índices)
+        band = std_multiplier * std
+        upper = middle + band
+        lower = middle - band
         
-        # Banda superior e inferior
-        data['bb_upper'] = data['bb_middle'] + (std_multiplier * std)
-        data['bb_lower'] = data['bb_middle'] - (std_multiplier * std)
+        data['bb_middle'] = middle
+        data['bb_upper'] = upper
+        data['bb_lower'] = lower
         
         # Calcular ancho de banda (útil para ver volatilidad)
-        data['bb_width'] = (data['bb_upper'] - data['bb_lower']) / data['bb_middle']
+        data['bb_width'] = (upper - lower) / middle
         
         return data
     
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Genera señales basadas en toques de bandas"""
-        data['signal'] = 0
+        # Arrays NumPy: el "valor anterior" es el slice [:-1], sin shift ni
+        # Series temporales
+        close = data['close'].to_numpy()
+        lower = data['bb_lower'].to_numpy()
+        upper = data['bb_upper'].to_numpy()
+        signal = np.zeros(len(close), dtype=np.int8)
         
         # COMPRAR: Precio cruza o toca banda inferior desde arriba
-        data.loc[
-            (data['close'] <= data['bb_lower']) &
-            (data['close'].shift(1) > data['bb_lower'].shift(1)),
-            'signal'
-        ] = 1
+        buy = np.zeros(len(close), dtype=bool)
+        buy[1:] = (close[1:] <= lower[1:]) & (close[:-1] > lower[:-1])
         
         # VENDER: Precio cruza o toca banda superior desde abajo
-        data.loc[
-            (data['close'] >= data['bb_upper']) &
-            (data['close'].shift(1) < data['bb_upper'].shift(1)),
-            'signal'
-        ] = -1
+        sell = np.zeros(len(close), dtype=bool)
+        sell[1:] = (close[1:] >= upper[1:]) & (close[:-1] < upper[:-1])
+        
+        signal[buy] = 1
+        signal[sell] = -1
+        data['signal'] = signal
         
         return data
     
     def validate_params(self) -> bool:
-        """Valida parámetros"""
-        period = self.params.get('period', 0)
-        std_dev = self.params.get('std_dev', 0)
+        """Valida parámetros (ValueError si alguno está fuera de rango)"""
+        period = self.params['period']
+        std_dev = self.params['std_dev']
         
-        if period <= 0:
-            return False
-        if std_dev <= 0:
-            return False
+        if not (period > 0 and std_dev > 0):
+            raise ValueError(
+                f"period and std_dev must be positive "
+                f"(period={period}, std_dev={std_dev})"
+            )
         
         return True
 
@@ -0,0 +1,338 @@
+"""
+Shared rolling-window indicators for strategies
+
+Usa bottleneck (ventanas móviles en C) cuando está instalado; si no, cae a
+pandas rolling. Ambos devuelven NaN hasta completar la ventana, igual que
+`Series.rolling(window).mean()/std()`. Para funciones propias sobre la
+ventana, rolling_apply usa el motor Numba de pandas si está disponible.
+Los indicadores recursivos (RSI de Wilder, EMAs del MACD) y el z-score móvil
+son kernels @njit que recorren la serie una vez.
+"""
+import numpy as np
+import pandas as pd
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op cuando Numba no está instalado"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _wilder_rsi(close, period):
+    """
+    RSI con el suavizado recursivo de Wilder, en una sola pasada
+    
+    La semilla es la media simple de las primeras `period` subas/bajadas;
+    después avg = (avg * (period - 1) + x) / period. Las variaciones con
+    algún precio NaN no entran en las medias y su barra queda en NaN.
+    
+    Returns:
+        Array con el RSI (NaN hasta completar `period` variaciones válidas)
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    
+    avg_gain = 0.0
+    avg_loss = 0.0
+    count = 0
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if np.isnan(delta):
+            continue
+        
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if count < period:
+            # Semilla: media simple de las primeras variaciones válidas
+            avg_gain += gain
+            avg_loss += loss
+            count += 1
+            if count < period:
+                continue
+            avg_gain /= period
+            avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        
+        rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss > 0 else 100.0
+    
+    return rsi
+
+
+def wilder_rsi(series: pd.Series, period: int) -> pd.Series:
+    """
+    RSI de Wilder (una sola pasada sobre los precios)
+    
+    Args:
+        series: Precios de cierre
+        period: Período del RSI
+    
+    Returns:
+        Serie con el RSI en [0, 100] (mismo índice, NaN al inicio)
+    """
+    values = _wilder_rsi(series.to_numpy(dtype=np.float64), period)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+@njit(cache=True)
+def _ema_update(ema, x, alpha, skipped):
+    """
+    Paso de una EMA con adjust=False que tolera huecos de NaN
+    
+    Como pandas (ignore_na=False), tras `skipped` barras sin dato la EMA
+    anterior pesa (1 - alpha) ** (skipped + 1) frente a alpha del nuevo
+    valor (pesos normalizados).
+    """
+    if skipped == 0:
+        return alpha * x + (1.0 - alpha) * ema
+    old_weight = (1.0 - alpha) ** (skipped + 1)
+    return (old_weight * ema + alpha * x) / (old_weight + alpha)
+
+
+@njit(cache=True)
+def _macd(close, alpha_fast, alpha_slow, alpha_signal):
+    """
+    Línea MACD y su señal con dos pasadas (ambas EMAs en la primera)
+    
+    Mismo resultado que `ewm(span, adjust=False).mean()`: cada EMA arranca
+    en el primer valor no NaN y sigue ema = alpha * x + (1 - alpha) * ema.
+    Las barras NaN repiten la EMA anterior (NaN antes del primer dato).
+    
+    Returns:
+        Tupla (macd, macd_signal)
+    """
+    n = close.shape[0]
+    macd = np.full(n, np.nan)
+    macd_signal = np.full(n, np.nan)
+    
+    ema_fast = np.nan
+    ema_slow = np.nan
+    skipped = 0
+    for i in range(n):
+        x = close[i]
+        if np.isnan(x):
+            skipped += 1
+        elif np.isnan(ema_fast):
+            ema_fast = x
+            ema_slow = x
+            skipped = 0
+        else:
+            ema_fast = _ema_update(ema_fast, x, alpha_fast, skipped)
+            ema_slow = _ema_update(ema_slow, x, alpha_slow, skipped)
+            skipped = 0
+        macd[i] = ema_fast - ema_slow
+    
+    # La línea MACD solo tiene NaN al inicio, antes del primer precio
+    ema_signal = np.nan
+    for i in range(n):
+        if np.isnan(ema_signal):
+            ema_signal = macd[i]
+        else:
+            ema_signal = alpha_signal * macd[i] + (1.0 - alpha_signal) * ema_signal
+        macd_signal[i] = ema_signal
+    
+    return macd, macd_signal
+
+
+def macd_lines(series: pd.Series, fast: int, slow: int, signal: int):
+    """
+    MACD (EMA rápida - EMA lenta) y su línea de señal
+    
+    Args:
+        series: Precios de cierre
+        fast: Span de la EMA rápida
+        slow: Span de la EMA lenta
+        signal: Span de la EMA de la línea MACD
+    
+    Returns:
+        Tupla de arrays (macd, macd_signal), listos para asignar como columnas
+    """
+    return _macd(
+        series.to_numpy(dtype=np.float64),
+        2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (signal + 1)
+    )
+
+
+@njit(cache=True)
+def _rolling_zscore(x, window):
+    """
+    Media, desviación estándar (ddof=1) y z-score móviles en una pasada
+    
+    Welford con ventana deslizante: al entrar un valor y salir otro se
+    actualizan la media y la suma de cuadrados de las desviaciones (m2),
+    sin restar sumas grandes de x y x² (pierden precisión con precios altos).
+    Los NaN no entran en la ventana; como en pandas rolling(window), solo
+    hay resultado cuando los `window` valores de la ventana son válidos.
+    
+    Returns:
+        Tupla (mean, std, z_score) con NaN hasta completar la ventana;
+        z_score es NaN si la ventana no tiene dispersión
+    """
+    n = x.shape[0]
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    z_score = np.full(n, np.nan)
+    
+    count = 0
+    m = 0.0
+    m2 = 0.0
+    for i in range(n):
+        new = x[i]
+        old = x[i - window] if i >= window else np.nan
+        new_valid = not np.isnan(new)
+        old_valid = not np.isnan(old)
+        
+        if new_valid and old_valid:
+            # Reemplazo: la cantidad de valores no cambia
+            prev_m = m
+            delta = new - old
+            m += delta / count
+            m2 += delta * (new - m + old - prev_m)
+        elif old_valid:
+            count -= 1
+            if count == 0:
+                m = 0.0
+                m2 = 0.0
+            else:
+                delta = old - m
+                m -= delta / count
+                m2 -= delta * (old - m)
+        elif new_valid:
+            count += 1
+            delta = new - m
+            m += delta / count
+            m2 += delta * (new - m)
+        
+        if count == window:
+            mean[i] = m
+            if window > 1:
+                sd = np.sqrt(max(m2 / (window - 1), 0.0))
+                std[i] = sd
+                if sd > 0:
+                    z_score[i] = (new - m) / sd
+    
+    return mean, std, z_score
+
+
+def rolling_zscore(series: pd.Series, window: int):
+    """
+    Media móvil, desviación estándar móvil y z-score en una sola pasada
+    
+    Equivale a rolling_mean, rolling_std y (x - mean) / std, leyendo la
+    serie una sola vez. Las ventanas con algún NaN dan NaN, como en pandas.
+    
+    Args:
+        series: Serie de entrada
+        window: Tamaño de la ventana
+    
+    Returns:
+        Tupla de arrays (mean, std, z_score), listos para asignar como columnas
+    """
+    return _rolling_zscore(series.to_numpy(dtype=np.float64), window)
+
+
+def rolling_mean(series: pd.Series, window: int) -> pd.Series:
+    """
+    Media móvil simple
+    
+    Args:
+        series: Serie de entrada
+        window: Tamaño de la ventana
+    
+    Returns:
+        Serie con la media móvil (mismo índice)
+    """
+    # bottleneck exige window <= len; series más cortas no llegan a la ventana
+    if bn is None or window > len(series):
+        return series.rolling(window=window).mean()
+    values = bn.move_mean(series.to_numpy(dtype=np.float64), window=window, min_count=window)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def rolling_std(series: pd.Series, window: int) -> pd.Series:
+    """
+    Desviación estándar móvil (muestral, ddof=1)
+    
+    Args:
+        series: Serie de entrada
+        window: Tamaño de la ventana
+    
+    Returns:
+        Serie con la desviación estándar móvil (mismo índice)
+    """
+    # bottleneck exige window <= len; series más cortas no llegan a la ventana
+    if bn is None or window > len(series):
+        return series.rolling(window=window).std()
+    values = bn.move_std(series.to_numpy(dtype=np.float64), window=window, min_count=window, ddof=1)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def rolling_apply(series: pd.Series, window: int, func) -> pd.Series:
+    """
+    Aplicar una función propia sobre cada ventana móvil
+    
+    Con Numba instalado, pandas compila func (engine='numba') y la cachea;
+    func debe aceptar un ndarray 1D y ser compatible con Numba (NumPy puro).
+    
+    Args:
+        series: Serie de entrada
+        window: Tamaño de la ventana
+        func: Función ndarray -> float
+    
+    Returns:
+        Serie con el resultado por ventana (mismo índice)
+    """
+    engine = 'numba' if NUMBA_AVAILABLE else 'cython'
+    return series.rolling(window=window).apply(func, raw=True, engine=engine)
+
+
+def cross_above(a, b) -> np.ndarray:
+    """
+    Barras donde `a` cruza por encima de `b` (a > b y antes a <= b)
+    
+    Equivale a `(a > b) & (a.shift(1) <= b.shift(1))` sobre arrays NumPy,
+    sin Series temporales. Los NaN no generan cruces.
+    
+    Args:
+        a: Array de valores
+        b: Array del mismo largo o escalar (nivel fijo)
+    
+    Returns:
+        Máscara booleana (la primera barra nunca es cruce)
+    """
+    a = np.asarray(a)
+    b = np.broadcast_to(b, a.shape)
+    mask = np.zeros(a.shape[0], dtype=bool)
+    mask[1:] = (a[1:] > b[1:]) & (a[:-1] <= b[:-1])
+    return mask
+
+
+def cross_below(a, b) -> np.ndarray:
+    """
+    Barras donde `a` cruza por debajo de `b` (a < b y antes a >= b)
+    
+    Args:
+        a: Array de valores
+        b: Array del mismo largo o escalar (nivel fijo)
+    
+    Returns:
+        Máscara booleana (la primera barra nunca es cruce)
+    """
+    a = np.asarray(a)
+    b = np.broadcast_to(b, a.shape)
+    mask = np.zeros(a.shape[0], dtype=bool)
+    mask[1:] = (a[1:] < b[1:]) & (a[:-1] >= b[:-1])
+    return mask
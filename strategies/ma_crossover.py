@@ -3,9 +3,11 @@ Moving Average Crossover Strategy
 Generates buy signals when fast MA crosses above slow MA
 Generates sell signals when fast MA crosses below slow MA
 """
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import cross_above, cross_below, rolling_mean
 
 
 class MovingAverageCrossover(BaseStrategy):
@@ -13,6 +15,11 @@ class MovingAverageCrossover(BaseStrategy):
     Moving Average Crossover Strategy
     """
     
+    __slots__ = ()
+    
+    # Columnas agregadas por calculate_indicators
+    indicator_columns = ('ma_fast', 'ma_slow')
+    
     def __init__(self, params: Dict[str, Any] = None):
         """
         Initialize MA Crossover strategy
@@ -42,8 +49,8 @@ class MovingAverageCrossover(BaseStrategy):
         fast_period = self.params['fast_period']
         slow_period = self.params['slow_period']
         
-        data['ma_fast'] = data['close'].rolling(window=fast_period).mean()
-        data['ma_slow'] = data['close'].rolling(window=slow_period).mean()
+        data['ma_fast'] = rolling_mean(data['close'], fast_period)
+        data['ma_slow'] = rolling_mean(data['close'], slow_period)
         
         return data
     
@@ -57,21 +64,17 @@ class MovingAverageCrossover(BaseStrategy):
         Returns:
             DataFrame with signals column
         """
-        data['signal'] = 0
+        ma_fast = data['ma_fast'].to_numpy()
+        ma_slow = data['ma_slow'].to_numpy()
+        signal = np.zeros(len(data), dtype=np.int8)
         
         # Buy signal: fast MA crosses above slow MA
-        data.loc[
-            (data['ma_fast'] > data['ma_slow']) &
-            (data['ma_fast'].shift(1) <= data['ma_slow'].shift(1)),
-            'signal'
-        ] = 1
+        signal[cross_above(ma_fast, ma_slow)] = 1
         
         # Sell signal: fast MA crosses below slow MA
-        data.loc[
-            (data['ma_fast'] < data['ma_slow']) &
-            (data['ma_fast'].shift(1) >= data['ma_slow'].shift(1)),
-            'signal'
-        ] = -1
+        signal[cross_below(ma_fast, ma_slow)] = -1
+        
+        data['signal'] = signal
         
         return data
     
@@ -81,14 +84,17 @@ class MovingAverageCrossover(BaseStrategy):
         
         Returns:
             True if parameters are valid
-        """
-        fast = self.params.get('fast_period', 0)
-        slow = self.params.get('slow_period', 0)
         
-        if fast <= 0 or slow <= 0:
-            return False
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        fast = self.params['fast_period']
+        slow = self.params['slow_period']
         
-        if fast >= slow:
-            return False
+        if not (0 < fast < slow):
+            raise ValueError(
+                f"periods must satisfy 0 < fast_period < slow_period "
+                f"(fast_period={fast}, slow_period={slow})"
+            )
         
         return True
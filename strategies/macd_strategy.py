@@ -3,9 +3,11 @@ MACD (Moving Average Convergence Divergence) Strategy
 Generates buy signals when MACD crosses above signal line
 Generates sell signals when MACD crosses below signal line
 """
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import cross_above, cross_below, macd_lines
 
 
 class MACDStrategy(BaseStrategy):
@@ -13,6 +15,11 @@ class MACDStrategy(BaseStrategy):
     MACD Trading Strategy
     """
     
+    __slots__ = ()
+    
+    # Columnas agregadas por calculate_indicators
+    indicator_columns = ('macd', 'macd_signal', 'macd_histogram')
+    
     def __init__(self, params: Dict[str, Any] = None):
         """
         Initialize MACD strategy
@@ -44,18 +51,13 @@ class MACDStrategy(BaseStrategy):
         slow = self.params['slow']
         signal = self.params['signal']
         
-        # Calculate EMAs
-        ema_fast = data['close'].ewm(span=fast, adjust=False).mean()
-        ema_slow = data['close'].ewm(span=slow, adjust=False).mean()
-        
-        # Calculate MACD line
-        data['macd'] = ema_fast - ema_slow
-        
-        # Calculate signal line
-        data['macd_signal'] = data['macd'].ewm(span=signal, adjust=False).mean()
+        # Calculate MACD and signal lines (both EMAs in one pass)
+        macd, macd_signal = macd_lines(data['close'], fast, slow, signal)
+        data['macd'] = macd
+        data['macd_signal'] = macd_signal
         
         # Calculate histogram
-        data['macd_histogram'] = data['macd'] - data['macd_signal']
+        data['macd_histogram'] = macd - macd_signal
         
         return data
     
@@ -69,21 +71,17 @@ class MACDStrategy(BaseStrategy):
         Returns:
             DataFrame with signals column
         """
-        data['signal'] = 0
+        macd = data['macd'].to_numpy()
+        macd_signal = data['macd_signal'].to_numpy()
+        signal = np.zeros(len(data), dtype=np.int8)
         
         # Buy signal: MACD crosses above signal line
-        data.loc[
-            (data['macd'] > data['macd_signal']) &
-            (data['macd'].shift(1) <= data['macd_signal'].shift(1)),
-            'signal'
-        ] = 1
+        signal[cross_above(macd, macd_signal)] = 1
         
         # Sell signal: MACD crosses below signal line
-        data.loc[
-            (data['macd'] < data['macd_signal']) &
-            (data['macd'].shift(1) >= data['macd_signal'].shift(1)),
-            'signal'
-        ] = -1
+        signal[cross_below(macd, macd_signal)] = -1
+        
+        data['signal'] = signal
         
         return data
     
@@ -93,15 +91,18 @@ class MACDStrategy(BaseStrategy):
         
         Returns:
             True if parameters are valid
-        """
-        fast = self.params.get('fast', 0)
-        slow = self.params.get('slow', 0)
-        signal = self.params.get('signal', 0)
         
-        if fast <= 0 or slow <= 0 or signal <= 0:
-            return False
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        fast = self.params['fast']
+        slow = self.params['slow']
+        signal = self.params['signal']
         
-        if fast >= slow:
-            return False
+        if not (0 < fast < slow and signal > 0):
+            raise ValueError(
+                f"spans must satisfy 0 < fast < slow and signal > 0 "
+                f"(fast={fast}, slow={slow}, signal={signal})"
+            )
         
         return True
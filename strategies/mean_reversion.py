@@ -6,6 +6,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import cross_above, cross_below, rolling_zscore
 
 
 class MeanReversionStrategy(BaseStrategy):
@@ -21,6 +22,11 @@ class MeanReversionStrategy(BaseStrategy):
     - |Z| < 1: Precio normal → No hacer nada
     """
     
+    __slots__ = ()
+    
+    # Columnas agregadas por calculate_indicators
+    indicator_columns = ('mean', 'std', 'z_score')
+    
     def __init__(self, params: Dict[str, Any] = None):
         default_params = {
             'lookback_period': 20,    # Período para calcular media
@@ -36,50 +42,42 @@ class MeanReversionStrategy(BaseStrategy):
         """Calcula Z-Score"""
         period = self.params['lookback_period']
         
-        # Media móvil
-        data['mean'] = data['close'].rolling(window=period).mean()
-        
-        # Desviación estándar
-        data['std'] = data['close'].rolling(window=period).std()
-        
-        # Z-Score: cuántas desviaciones estándar se aleja el precio de la media
-        data['z_score'] = (data['close'] - data['mean']) / data['std']
+        # Media móvil, desviación estándar y Z-Score (cuántas desviaciones
+        # estándar se aleja el precio de la media), en una sola pasada
+        data['mean'], data['std'], data['z_score'] = rolling_zscore(data['close'], period)
         
         return data
     
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Genera señales basadas en Z-Score"""
-        data['signal'] = 0
-        
         entry_threshold = self.params['entry_threshold']
         exit_threshold = self.params['exit_threshold']
         
+        z_score = data['z_score'].to_numpy()
+        signal = np.zeros(len(data), dtype=np.int8)
+        
         # COMPRAR: Z-Score muy negativo (precio muy bajo)
-        data.loc[
-            (data['z_score'] < -entry_threshold) &
-            (data['z_score'].shift(1) >= -entry_threshold),
-            'signal'
-        ] = 1
+        signal[cross_below(z_score, -entry_threshold)] = 1
         
         # VENDER: Z-Score muy positivo (precio muy alto)
-        data.loc[
-            (data['z_score'] > entry_threshold) &
-            (data['z_score'].shift(1) <= entry_threshold),
-            'signal'
-        ] = -1
+        signal[cross_above(z_score, entry_threshold)] = -1
         
         # También vender si vuelve a la media después de comprar
-        data.loc[
-            (data['z_score'] > -exit_threshold) &
-            (data['z_score'].shift(1) <= -exit_threshold),
-            'signal'
-        ] = -1
+        signal[cross_above(z_score, -exit_threshold)] = -1
+        
+        data['signal'] = signal
         
         return data
     
     def validate_params(self) -> bool:
-        """Valida parámetros"""
-        return self.params.get('lookback_period', 0) > 0
+        """Valida parámetros (ValueError si alguno está fuera de rango)"""
+        lookback_period = self.params['lookback_period']
+        if lookback_period <= 0:
+            raise ValueError(
+                f"lookback_period must be positive (lookback_period={lookback_period})"
+            )
+        
+        return True
 
 
 """
@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import cross_above, cross_below, macd_lines, rolling_mean, wilder_rsi
 
 
 class MultiIndicatorStrategy(BaseStrategy):
@@ -23,6 +24,11 @@ class MultiIndicatorStrategy(BaseStrategy):
     2. MACD cruza hacia abajo
     """
     
+    __slots__ = ()
+    
+    # Columnas agregadas por calculate_indicators
+    indicator_columns = ('rsi', 'macd', 'macd_signal', 'volume_ma')
+    
     def __init__(self, params: Dict[str, Any] = None):
         default_params = {
             'rsi_period': 14,
@@ -43,68 +49,64 @@ class MultiIndicatorStrategy(BaseStrategy):
         
         # === RSI ===
         rsi_period = self.params['rsi_period']
-        delta = data['close'].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        avg_gain = gain.rolling(window=rsi_period).mean()
-        avg_loss = loss.rolling(window=rsi_period).mean()
-        rs = avg_gain / avg_loss
-        data['rsi'] = 100 - (100 / (1 + rs))
+        data['rsi'] = wilder_rsi(data['close'], rsi_period)
         
         # === MACD ===
         fast = self.params['macd_fast']
         slow = self.params['macd_slow']
         signal = self.params['macd_signal']
         
-        ema_fast = data['close'].ewm(span=fast, adjust=False).mean()
-        ema_slow = data['close'].ewm(span=slow, adjust=False).mean()
-        data['macd'] = ema_fast - ema_slow
-        data['macd_signal'] = data['macd'].ewm(span=signal, adjust=False).mean()
+        data['macd'], data['macd_signal'] = macd_lines(data['close'], fast, slow, signal)
         
         # === VOLUMEN ===
         volume_period = self.params['volume_period']
-        data['volume_ma'] = data['volume'].rolling(window=volume_period).mean()
+        data['volume_ma'] = rolling_mean(data['volume'], volume_period)
         
         return data
     
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Genera señales confirmadas por múltiples indicadores"""
-        data['signal'] = 0
-        
         rsi_oversold = self.params['rsi_oversold']
         rsi_overbought = self.params['rsi_overbought']
         
+        rsi = data['rsi'].to_numpy()
+        macd = data['macd'].to_numpy()
+        macd_signal = data['macd_signal'].to_numpy()
+        signal = np.zeros(len(data), dtype=np.int8)
+        
         # COMPRAR: Todas las condiciones deben cumplirse
         buy_condition = (
             # 1. RSI en sobreventa
-            (data['rsi'] < rsi_oversold) &
+            (rsi < rsi_oversold) &
             # 2. MACD cruza hacia arriba
-            (data['macd'] > data['macd_signal']) &
-            (data['macd'].shift(1) <= data['macd_signal'].shift(1)) &
+            cross_above(macd, macd_signal) &
             # 3. Volumen alto (confirmación de movimiento real)
-            (data['volume'] > data['volume_ma'])
+            (data['volume'].to_numpy() > data['volume_ma'].to_numpy())
         )
         
-        data.loc[buy_condition, 'signal'] = 1
+        signal[buy_condition] = 1
         
         # VENDER: Cualquiera de estas condiciones
         sell_condition = (
             # RSI en sobrecompra
-            (data['rsi'] > rsi_overbought) |
+            (rsi > rsi_overbought) |
             # O MACD cruza hacia abajo
-            (
-                (data['macd'] < data['macd_signal']) &
-                (data['macd'].shift(1) >= data['macd_signal'].shift(1))
-            )
+            cross_below(macd, macd_signal)
         )
         
-        data.loc[sell_condition, 'signal'] = -1
+        signal[sell_condition] = -1
+        
+        data['signal'] = signal
         
         return data
     
     def validate_params(self) -> bool:
-        """Valida parámetros"""
-        return self.params.get('rsi_period', 0) > 0
+        """Valida parámetros (ValueError si alguno está fuera de rango)"""
+        rsi_period = self.params['rsi_period']
+        if rsi_period <= 0:
+            raise ValueError(f"rsi_period must be positive (rsi_period={rsi_period})")
+        
+        return True
 
 
 """
@@ -16,9 +16,59 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from strategies.base_multi_symbol_strategy import MultiSymbolStrategy
+from strategies.indicators import njit, rolling_mean, rolling_std
 from utils.pair_data_fetcher import PairDataFetcher
 
 
+@njit(cache=True)
+def _pair_signals(z_score, entry_threshold, exit_threshold):
+    """
+    Recorrer el z-score una vez con la máquina de estados del par
+    
+    Args:
+        z_score: Z-score del spread (NaN hasta completar la ventana)
+        entry_threshold: |z| a partir del cual se abre el spread
+        exit_threshold: |z| por debajo del cual se cierra
+    
+    Returns:
+        Tupla (señales de symbol_a, señales de symbol_b) en int8
+    """
+    n = z_score.shape[0]
+    signal_a = np.zeros(n, dtype=np.int8)
+    signal_b = np.zeros(n, dtype=np.int8)
+    position_state = 0  # 0 = flat, 1 = long spread, -1 = short spread
+    
+    for i in range(n):
+        z = z_score[i]
+        
+        # Skip if z_score is NaN (not enough data yet)
+        if np.isnan(z):
+            continue
+        
+        # Entry signals (when flat)
+        if position_state == 0:
+            # Spread too low: buy spread (long A, short B)
+            if z < -entry_threshold:
+                signal_a[i] = 1
+                signal_b[i] = -1
+                position_state = 1
+            
+            # Spread too high: short spread (short A, long B)
+            elif z > entry_threshold:
+                signal_a[i] = -1
+                signal_b[i] = 1
+                position_state = -1
+        
+        # Exit signals: spread normalized, close positions
+        elif abs(z) < exit_threshold:
+            # Cerrar long spread (vender A, comprar B) o short spread
+            signal_a[i] = -position_state
+            signal_b[i] = position_state
+            position_state = 0
+    
+    return signal_a, signal_b
+
+
 class PairTradingStrategy(MultiSymbolStrategy):
     """
     Pair trading strategy using z-score of price spread.
@@ -36,6 +86,8 @@ class PairTradingStrategy(MultiSymbolStrategy):
         - Both = 0: Exit positions (spread normalized)
     """
     
+    __slots__ = ('pair_fetcher', 'symbol_a', 'symbol_b')
+    
     def __init__(self, symbols: List[str], params: Optional[Dict[str, Any]] = None):
         """
         Initialize pair trading strategy.
@@ -94,8 +146,9 @@ class PairTradingStrategy(MultiSymbolStrategy):
         - spread_std: Rolling standard deviation of spread
         - z_score: Standardized spread deviation
         """
-        data_a = data_dict[self.symbol_a].copy()
-        data_b = data_dict[self.symbol_b].copy()
+        # Solo lectura: las columnas nuevas se agregan sobre data_dict
+        data_a = data_dict[self.symbol_a]
+        data_b = data_dict[self.symbol_b]
         
         window = self.params['window']
         hedge_ratio = self.params['hedge_ratio']
@@ -111,8 +164,8 @@ class PairTradingStrategy(MultiSymbolStrategy):
         spread = data_a['close'] - (hedge_ratio * data_b['close'])
         
         # Calculate rolling statistics of spread
-        spread_mean = spread.rolling(window=window).mean()
-        spread_std = spread.rolling(window=window).std()
+        spread_mean = rolling_mean(spread, window)
+        spread_std = rolling_std(spread, window)
         
         # Calculate z-score (how many standard deviations from mean)
         z_score = (spread - spread_mean) / spread_std
@@ -145,57 +198,18 @@ class PairTradingStrategy(MultiSymbolStrategy):
         - symbol_a: 1 (long), -1 (short), 0 (hold)
         - symbol_b: -1 (short), 1 (long), 0 (hold) [opposite of symbol_a]
         """
-        data_a = data_dict[self.symbol_a].copy()
-        data_b = data_dict[self.symbol_b].copy()
-        
-        entry_threshold = self.params['entry_threshold']
-        exit_threshold = self.params['exit_threshold']
-        
-        # Initialize signal columns
-        data_a['signal'] = 0
-        data_b['signal'] = 0
-        
-        # Track current position state
-        position_state = 0  # 0 = flat, 1 = long spread, -1 = short spread
+        z_score = data_dict[self.symbol_a]['z_score'].to_numpy(dtype=np.float64)
+        
+        # Recorrido secuencial (el estado depende de la barra anterior),
+        # compilado con Numba cuando está instalado
+        signal_a, signal_b = _pair_signals(
+            z_score,
+            float(self.params['entry_threshold']),
+            float(self.params['exit_threshold'])
+        )
         
-        for i in range(len(data_a)):
-            z_score = data_a['z_score'].iloc[i]
-            
-            # Skip if z_score is NaN (not enough data yet)
-            if pd.isna(z_score):
-                continue
-            
-            # Entry signals (when flat)
-            if position_state == 0:
-                # Spread too low: buy spread (long A, short B)
-                if z_score < -entry_threshold:
-                    data_a.iloc[i, data_a.columns.get_loc('signal')] = 1
-                    data_b.iloc[i, data_b.columns.get_loc('signal')] = -1
-                    position_state = 1
-                
-                # Spread too high: short spread (short A, long B)
-                elif z_score > entry_threshold:
-                    data_a.iloc[i, data_a.columns.get_loc('signal')] = -1
-                    data_b.iloc[i, data_b.columns.get_loc('signal')] = 1
-                    position_state = -1
-            
-            # Exit signals (when in position)
-            else:
-                # Spread normalized: close positions
-                if abs(z_score) < exit_threshold:
-                    # Close long spread position
-                    if position_state == 1:
-                        data_a.iloc[i, data_a.columns.get_loc('signal')] = -1
-                        data_b.iloc[i, data_b.columns.get_loc('signal')] = 1
-                    # Close short spread position
-                    elif position_state == -1:
-                        data_a.iloc[i, data_a.columns.get_loc('signal')] = 1
-                        data_b.iloc[i, data_b.columns.get_loc('signal')] = -1
-                    
-                    position_state = 0
-        
-        data_dict[self.symbol_a] = data_a
-        data_dict[self.symbol_b] = data_b
+        data_dict[self.symbol_a]['signal'] = signal_a
+        data_dict[self.symbol_b]['signal'] = signal_b
         
         return data_dict
     
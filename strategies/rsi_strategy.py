@@ -3,9 +3,11 @@ RSI (Relative Strength Index) Strategy
 Generates buy signals when RSI is oversold
 Generates sell signals when RSI is overbought
 """
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import cross_above, cross_below, wilder_rsi
 
 
 class RSIStrategy(BaseStrategy):
@@ -13,6 +15,11 @@ class RSIStrategy(BaseStrategy):
     RSI Trading Strategy
     """
     
+    __slots__ = ()
+    
+    # Columnas agregadas por calculate_indicators
+    indicator_columns = ('rsi',)
+    
     def __init__(self, params: Dict[str, Any] = None):
         """
         Initialize RSI strategy
@@ -42,20 +49,8 @@ class RSIStrategy(BaseStrategy):
         """
         period = self.params['period']
         
-        # Calculate price changes
-        delta = data['close'].diff()
-        
-        # Separate gains and losses
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        
-        # Calculate average gains and losses
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
-        
-        # Calculate RS and RSI
-        rs = avg_gain / avg_loss
-        data['rsi'] = 100 - (100 / (1 + rs))
+        # Wilder's RSI: gains, losses and their smoothed averages in one pass
+        data['rsi'] = wilder_rsi(data['close'], period)
         
         return data
     
@@ -72,21 +67,16 @@ class RSIStrategy(BaseStrategy):
         oversold = self.params['oversold']
         overbought = self.params['overbought']
         
-        data['signal'] = 0
+        rsi = data['rsi'].to_numpy()
+        signal = np.zeros(len(data), dtype=np.int8)
         
         # Buy signal: RSI crosses above oversold level
-        data.loc[
-            (data['rsi'] > oversold) &
-            (data['rsi'].shift(1) <= oversold),
-            'signal'
-        ] = 1
+        signal[cross_above(rsi, oversold)] = 1
         
         # Sell signal: RSI crosses below overbought level
-        data.loc[
-            (data['rsi'] < overbought) &
-            (data['rsi'].shift(1) >= overbought),
-            'signal'
-        ] = -1
+        signal[cross_below(rsi, overbought)] = -1
+        
+        data['signal'] = signal
         
         return data
     
@@ -96,21 +86,22 @@ class RSIStrategy(BaseStrategy):
         
         Returns:
             True if parameters are valid
+        
+        Raises:
+            ValueError: If a parameter is out of range
         """
-        period = self.params.get('period', 0)
-        oversold = self.params.get('oversold', 0)
-        overbought = self.params.get('overbought', 0)
+        period = self.params['period']
+        oversold = self.params['oversold']
+        overbought = self.params['overbought']
         
         if period <= 0:
-            return False
-        
-        if oversold <= 0 or oversold >= 50:
-            return False
-        
-        if overbought <= 50 or overbought >= 100:
-            return False
-        
-        if oversold >= overbought:
-            return False
+            raise ValueError(f"period must be positive (period={period})")
+        
+        # 0 < oversold < 50 < overbought < 100 (implica oversold < overbought)
+        if not (0 < oversold < 50 < overbought < 100):
+            raise ValueError(
+                f"thresholds must satisfy 0 < oversold < 50 < overbought < 100 "
+                f"(oversold={oversold}, overbought={overbought})"
+            )
         
         return True
@@ -0,0 +1,215 @@
+"""
+Tests for the single-symbol Backtester
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from backtesting.backtester import Backtester, MultiSymbolBacktester
+from strategies.base_strategy import BaseStrategy
+from strategies.base_multi_symbol_strategy import MultiSymbolStrategy
+
+
+class FixedSignalStrategy(BaseStrategy):
+    """Strategy that replays a predefined signal list"""
+    
+    def __init__(self, signals):
+        super().__init__("Fixed Signals")
+        self.signals = signals
+    
+    def calculate_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data
+    
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        data['signal'] = self.signals
+        return data
+
+
+class FixedMultiSignalStrategy(MultiSymbolStrategy):
+    """Multi-symbol strategy that replays predefined signals per symbol"""
+    
+    def __init__(self, signals_by_symbol):
+        super().__init__("Fixed Multi Signals", list(signals_by_symbol))
+        self.signals_by_symbol = signals_by_symbol
+    
+    def fetch_multi_symbol_data(self, symbols, start_date=None, end_date=None, timeframe='1d'):
+        raise NotImplementedError
+    
+    def calculate_multi_symbol_indicators(self, data_dict):
+        return data_dict
+    
+    def generate_multi_symbol_signals(self, data_dict):
+        for symbol, signals in self.signals_by_symbol.items():
+            data_dict[symbol]['signal'] = signals
+        return data_dict
+
+
+def make_data(closes):
+    dates = pd.date_range('2024-01-01', periods=len(closes))
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame({
+        'open': closes,
+        'high': closes,
+        'low': closes,
+        'close': closes,
+        'volume': np.ones(len(closes))
+    }, index=dates)
+
+
+class TestBacktester:
+    """Tests for single-symbol Backtester runs"""
+    
+    def test_buy_and_sell_round_trip(self):
+        """Test a single buy/sell round trip without costs"""
+        data = make_data([10, 10, 12, 15, 15])
+        strategy = FixedSignalStrategy([0, 1, 0, -1, 0])
+        results = Backtester(strategy, initial_capital=1000, commission=0.0).run(data)
+        
+        assert [t['type'] for t in results['trades']] == ['BUY', 'SELL']
+        assert results['trades'][0]['shares'] == 100
+        assert results['trades'][0]['date'] == data.index[1]
+        assert results['equity_curve'] == [1000, 1000, 1200, 1500, 1500]
+        assert results['final_capital'] == 1500
+        assert results['win_rate'] == 100.0
+    
+    def test_repeated_signals_are_ignored(self):
+        """Test that buy while long and sell while flat do nothing"""
+        data = make_data([10, 10, 20, 20, 25])
+        strategy = FixedSignalStrategy([-1, 1, 1, -1, -1])
+        results = Backtester(strategy, initial_capital=1000, commission=0.0).run(data)
+        
+        assert len(results['trades']) == 2
+        assert results['trades'][1]['date'] == data.index[3]
+        assert results['equity_curve'] == [1000, 1000, 2000, 2000, 2000]
+    
+    def test_open_position_closed_at_end(self):
+        """Test that an open position is closed at the last price"""
+        data = make_data([10, 10, 11])
+        strategy = FixedSignalStrategy([1, 0, 0])
+        results = Backtester(strategy, initial_capital=1000, commission=0.01).run(data)
+        
+        trades = results['trades']
+        assert [t['type'] for t in trades] == ['BUY', 'SELL']
+        assert trades[-1]['date'] == data.index[-1]
+        assert trades[-1]['capital'] == pytest.approx(
+            1000 - 99 * 10 * 1.01 + 99 * 11 * 0.99
+        )
+    
+    def test_float32_prices_keep_metrics(self):
+        """Test that the float32 option does not change trades or metrics"""
+        rng = np.random.default_rng(0)
+        closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 300)))
+        signals = np.zeros(300)
+        signals[20::50] = 1
+        signals[45::50] = -1
+        data = make_data(closes)
+        
+        results = Backtester(FixedSignalStrategy(signals)).run(data)
+        results32 = Backtester(FixedSignalStrategy(signals), use_float32=True).run(data)
+        
+        assert len(results32['trades']) == len(results['trades'])
+        assert results32['sharpe_ratio'] == pytest.approx(results['sharpe_ratio'], abs=1e-6)
+        assert results32['max_drawdown'] == pytest.approx(results['max_drawdown'], abs=1e-4)
+        assert data['close'].dtype == np.float64
+    
+    def test_save_results_persists_run(self, tmp_path):
+        """Test that save_results writes the backtest to the results logger"""
+        from utils.results_logger import ResultsLogger
+        
+        data = make_data([10, 10, 12, 15, 15])
+        data.attrs['symbol'] = 'BTC/USDT'
+        backtester = Backtester(FixedSignalStrategy([0, 1, 0, -1, 0]), save_results=True)
+        backtester.results_logger = ResultsLogger(results_dir=str(tmp_path))
+        backtester.run(data)
+        path = backtester.wait_for_save()
+        
+        saved = list(tmp_path.glob('Fixed Signals_BTC_USDT_*.json'))
+        assert [str(p) for p in saved] == [path]
+    
+    def test_save_results_share_one_io_thread(self, tmp_path):
+        """Test that many saving Backtesters reuse a single I/O thread"""
+        import threading
+        from utils.results_logger import ResultsLogger
+        
+        data = make_data([10, 10, 12, 15, 15])
+        paths = []
+        for _ in range(5):
+            backtester = Backtester(FixedSignalStrategy([0, 1, 0, -1, 0]), save_results=True)
+            backtester.results_logger = ResultsLogger(results_dir=str(tmp_path))
+            backtester.run(data)
+            paths.append(backtester.wait_for_save())
+        
+        io_threads = [t for t in threading.enumerate() if t.name.startswith('backtest-io')]
+        assert len(io_threads) == 1
+        assert all(paths)
+    
+    def test_cache_indicators_reuses_prepared_data(self):
+        """Test that cached runs skip indicator calculation for identical inputs"""
+        class CountingStrategy(FixedSignalStrategy):
+            calls = 0
+            
+            def calculate_indicators(self, data):
+                CountingStrategy.calls += 1
+                return data
+        
+        data = make_data([10, 10, 12, 15, 15])
+        strategy = CountingStrategy([0, 1, 0, -1, 0])
+        first = Backtester(strategy, cache_indicators=True).run(data)
+        second = Backtester(strategy, cache_indicators=True).run(data.copy())
+        assert CountingStrategy.calls == 1
+        assert second['equity_curve'] == first['equity_curve']
+        
+        strategy.params = {'variant': 2}
+        Backtester(strategy, cache_indicators=True).run(data)
+        assert CountingStrategy.calls == 2
+    
+    def test_reused_backtester_matches_fresh_runs(self):
+        """Test that reusing one Backtester (shared equity buffer) keeps results"""
+        long_data = make_data([10, 10, 12, 15, 15, 9, 11])
+        short_data = make_data([10, 20, 30])
+        long_strategy = FixedSignalStrategy([0, 1, 0, -1, 1, 0, -1])
+        short_strategy = FixedSignalStrategy([1, 0, 0])
+        
+        backtester = Backtester(long_strategy)
+        long_results = backtester.run(long_data)
+        backtester.strategy = short_strategy
+        short_results = backtester.run(short_data)
+        
+        assert long_results['equity_curve'] == Backtester(long_strategy).run(long_data)['equity_curve']
+        assert short_results['equity_curve'] == Backtester(short_strategy).run(short_data)['equity_curve']
+    
+    def test_data_with_signals_exposes_prepared_frame(self):
+        """Test that the last run's indicators/signals are kept without touching the input"""
+        data = make_data([10, 10, 12, 15, 15])
+        backtester = Backtester(FixedSignalStrategy([0, 1, 0, -1, 0]))
+        backtester.run(data)
+        
+        assert backtester.data_with_signals['signal'].tolist() == [0, 1, 0, -1, 0]
+        assert 'signal' not in data.columns
+
+
+class TestMultiSymbolBacktester:
+    """Tests for MultiSymbolBacktester runs"""
+    
+    def test_multi_symbol_long_short_and_cover(self):
+        """Test multi-symbol long, short, cover and final close bookkeeping"""
+        data_dict = {
+            'A': make_data([10, 10, 20, 20]),
+            'B': make_data([10, 10, 5, 5])
+        }
+        strategy = FixedMultiSignalStrategy({
+            'A': [1, 0, -1, 0],
+            'B': [-1, 0, 1, 0]
+        })
+        results = MultiSymbolBacktester(strategy, initial_capital=1000, commission=0.0).run(data_dict)
+        
+        trades = [(t['symbol'], t['type'], t['shares']) for t in results['trades']]
+        # A: compra y luego venta + corto; B: corto y luego cobertura + compra
+        assert trades == [
+            ('A', 'BUY', 50), ('B', 'SHORT', 25),
+            ('A', 'SELL', 50), ('A', 'SHORT', 43),
+            ('B', 'COVER', 25), ('B', 'BUY', 261),
+            ('A', 'COVER', 43), ('B', 'SELL', 261)
+        ]
+        assert results['equity_curve'][1] == 1000
+        assert results['trades'][-1]['capital'] == 1625
+        assert results['final_capital'] == 1625
@@ -0,0 +1,42 @@
+"""
+Unit tests for api/routers/backtests.py - keyset pagination cursor
+"""
+import pytest
+from datetime import datetime, timezone
+from urllib.parse import unquote_plus
+from fastapi import HTTPException
+
+from api.routers.backtests import _encode_cursor, _parse_cursor
+
+
+class TestBacktestCursor:
+    """Tests for the X-Next-Cursor encoding"""
+    
+    def test_round_trip_with_utc_offset(self):
+        """Test an aware executed_at survives encode/parse unchanged"""
+        executed_at = datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc)
+        cursor = _encode_cursor(executed_at, 42)
+        
+        assert _parse_cursor(cursor) == (executed_at, 42)
+    
+    def test_round_trip_naive(self):
+        """Test a naive executed_at (e.g. from SQLite) round-trips too"""
+        executed_at = datetime(2024, 1, 1, 12, 30)
+        
+        assert _parse_cursor(_encode_cursor(executed_at, 7)) == (executed_at, 7)
+    
+    def test_cursor_is_query_safe(self):
+        """Test the cursor is unchanged when sent back unencoded in a query"""
+        executed_at = datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc)
+        cursor = _encode_cursor(executed_at, 42)
+        
+        assert unquote_plus(cursor) == cursor
+        assert _parse_cursor(unquote_plus(cursor)) == (executed_at, 42)
+    
+    @pytest.mark.parametrize("cursor", ["not a cursor", "!!!", "bm8tc2VwYXJhdG9y"])
+    def test_invalid_cursor(self, cursor):
+        """Test malformed cursors are rejected with 400"""
+        with pytest.raises(HTTPException) as exc_info:
+            _parse_cursor(cursor)
+        
+        assert exc_info.value.status_code == 400
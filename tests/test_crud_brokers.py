@@ -14,6 +14,7 @@ from api.crud_brokers import (
     update_broker_config,
     get_broker_credentials,
     get_broker_credential,
+    get_broker_credential_response,
     create_broker_credential,
     update_broker_credential,
     delete_broker_credential,
@@ -247,6 +248,33 @@ class TestBrokerCredentialCRUD:
             # api_key should not be in response
             assert not hasattr(cred, 'api_key')
     
+    def test_get_broker_credential_response_flags(self, test_db, sample_broker_config):
+        """Test has_* flags are computed in SQL with the bool() rule"""
+        from api.models import BrokerCredentialCreate
+        
+        cred_data = BrokerCredentialCreate(
+            broker_config_id=sample_broker_config.id,
+            api_key="key",
+            api_secret="secret"
+        )
+        created = create_broker_credential(test_db, cred_data, user_id=1)
+        
+        # Empty string counts as missing, like bool("")
+        created.api_secret_encrypted = ""
+        test_db.commit()
+        
+        response = get_broker_credential_response(test_db, created.id, user_id=1)
+        assert response.has_api_key is True
+        assert response.has_api_secret is False
+        assert response.has_api_passphrase is False
+        assert response.broker_name == sample_broker_config.broker_name
+        
+        listed = get_broker_credentials(test_db, user_id=1)[0]
+        assert listed.model_dump() == response.model_dump()
+        
+        # Other users can't see it
+        assert get_broker_credential_response(test_db, created.id, user_id=2) is None
+    
     def test_get_credentials_filtered_by_type(self, test_db, sample_broker_config):
         """Test filtering credentials by broker type"""
         from api.models import BrokerCredentialCreate, BrokerConfigCreate
@@ -300,7 +328,7 @@ class TestBrokerCredentialCRUD:
         
         # Get without decryption
         cred_no_decrypt = get_broker_credential(test_db, created.id, user_id=1, decrypt=False)
-        assert not hasattr(cred_no_decrypt, 'api_key_decrypted')
+        assert cred_no_decrypt.api_key_decrypted is None
         
         # Get with decryption
         cred_decrypted = get_broker_credential(test_db, created.id, user_id=1, decrypt=True)
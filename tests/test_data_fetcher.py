@@ -0,0 +1,67 @@
+"""
+Tests for the DataFetcher recent-window cache
+"""
+import pandas as pd
+import numpy as np
+from utils.data_fetcher import DataFetcher
+
+
+def make_fetcher(monkeypatch):
+    """DataFetcher whose DB reads are counted instead of executed"""
+    fetcher = DataFetcher()
+    calls = []
+
+    def fake_fetch_from_db(symbol, start_date=None, end_date=None, timeframe='1d'):
+        calls.append(symbol)
+        dates = pd.date_range(end=end_date, periods=5, freq='D')
+        return pd.DataFrame({'close': np.arange(5.0)}, index=dates)
+
+    monkeypatch.setattr(fetcher, 'fetch_from_db', fake_fetch_from_db)
+    return fetcher, calls
+
+
+def test_fetch_recent_reuses_cached_window(monkeypatch):
+    """Test that repeated requests for the same window hit the DB once"""
+    fetcher, calls = make_fetcher(monkeypatch)
+
+    first = fetcher.fetch_recent('BTC/USDT', days=30)
+    second = fetcher.fetch_recent('BTC/USDT', days=30)
+    fetcher.fetch_recent('ETH/USDT', days=30)
+
+    assert calls == ['BTC/USDT', 'ETH/USDT']
+    assert first.equals(second)
+
+    # Callers can add columns without touching the cached frame
+    second['signal'] = 0
+    assert 'signal' not in fetcher.fetch_recent('BTC/USDT', days=30).columns
+
+
+def test_invalidate_cache_forces_reload(monkeypatch):
+    """Test that new ingested data invalidates cached windows"""
+    fetcher, calls = make_fetcher(monkeypatch)
+
+    fetcher.fetch_recent('BTC/USDT', days=30)
+    fetcher.invalidate_cache()
+    fetcher.fetch_recent('BTC/USDT', days=30)
+
+    assert calls == ['BTC/USDT', 'BTC/USDT']
+
+
+def test_fetch_from_db_builds_float_ohlcv(monkeypatch):
+    """Test that DB records become a float OHLCV frame indexed by timestamp"""
+    from types import SimpleNamespace
+    from datetime import datetime
+    import utils.data_fetcher as data_fetcher_module
+
+    records = [
+        SimpleNamespace(timestamp=datetime(2024, 1, day), open=1, high=2.5, low=0.5, close=2, volume=10)
+        for day in (1, 2)
+    ]
+    monkeypatch.setattr(data_fetcher_module.crud, 'get_market_data', lambda **kwargs: records)
+
+    df = DataFetcher().fetch_from_db('BTC/USDT')
+
+    assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+    assert all(dtype == np.float64 for dtype in df.dtypes)
+    assert df.index[1] == pd.Timestamp('2024-01-02')
+    assert df['high'].tolist() == [2.5, 2.5]
@@ -214,6 +214,31 @@ class TestPairTradingStrategy(unittest.TestCase):
         first_trade = results['trades'][0]
         self.assertIn('symbol', first_trade)
         self.assertIn(first_trade['symbol'], self.symbols)
+    
+    def test_panel_round_trip(self):
+        """Test (symbol, field) panel alignment and the dict shim"""
+        data_dict = {
+            'BTC/USDT': self.data_a,
+            'ETH/USDT': self.data_b.iloc[10:]
+        }
+        panel = PairTradingStrategy.to_panel(data_dict)
+        
+        closes = panel.xs('close', axis=1, level=1).to_numpy()
+        self.assertEqual(closes.shape, (90, 2))
+        np.testing.assert_array_equal(closes[:, 0], self.data_a['close'].to_numpy()[10:])
+        
+        back = PairTradingStrategy.panel_to_dict(panel)
+        self.assertEqual(list(back), ['BTC/USDT', 'ETH/USDT'])
+        pd.testing.assert_frame_equal(back['ETH/USDT'], self.data_b.iloc[10:])
+    
+    def test_position_summary_from_array(self):
+        """Test that position summary reads the per-symbol position array"""
+        strategy = PairTradingStrategy(symbols=['BTC/USDT', 'ETH/USDT'])
+        strategy.symbol_positions[strategy.symbol_index['ETH/USDT']] = -5
+        
+        summary = strategy.get_position_summary()
+        self.assertEqual(summary['positions'], {'BTC/USDT': 0, 'ETH/USDT': -5})
+        self.assertEqual(summary['num_positions'], 1)
 
 
 class TestPairDataFetcher(unittest.TestCase):
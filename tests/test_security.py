@@ -193,6 +193,17 @@ class TestEncryptionServiceWithCustomKey:
         
         # Cleanup
         get_encryption_service.cache_clear()
+    
+    def test_missing_key_fails_in_production(self, monkeypatch):
+        """Test that production never falls back to a temporary key"""
+        monkeypatch.delenv("ENCRYPTION_KEY", raising=False)
+        monkeypatch.setenv("APP_ENV", "production")
+        
+        with pytest.raises(ValueError):
+            EncryptionService()
+        
+        with pytest.raises(ValueError):
+            EncryptionService("not-a-valid-key")
 
 
 class TestEncryptionEdgeCases:
@@ -243,5 +254,25 @@ class TestEncryptionEdgeCases:
         assert decrypted == json_str
 
 
+class TestFastCipher:
+    """Test the optional rfernet fast path against cryptography's Fernet"""
+    
+    def test_tokens_roundtrip_between_implementations(self):
+        """Test that tokens from either implementation decrypt with the other"""
+        pytest.importorskip("rfernet")
+        service = EncryptionService(Fernet.generate_key().decode())
+        assert service._fast_cipher is not None
+        original = "api_key_ñ_12345"
+        
+        # cryptography -> rfernet (fast path de decrypt)
+        token = service.cipher.encrypt(original.encode()).decode()
+        assert service.decrypt(token) == original
+        
+        # rfernet (fast path de encrypt) -> cryptography
+        token = service.encrypt(original)
+        assert isinstance(token, str)
+        assert service.cipher.decrypt(token.encode()).decode() == original
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
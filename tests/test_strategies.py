@@ -69,4 +69,160 @@ def test_validate_params():
     
     # Invalid params (fast >= slow)
     strategy = MovingAverageCrossover({'fast_period': 50, 'slow_period': 20})
-    assert strategy.validate_params() is False
+    with pytest.raises(ValueError, match='fast_period'):
+        strategy.validate_params()
+
+
+def test_bollinger_band_touch_signals():
+    """Test Bollinger buy/sell signals on band crossings (no signal during warm-up)"""
+    from strategies.bollinger_bands import BollingerBandsStrategy
+
+    closes = [10, 11, 10, 11, 10, 7, 10, 11, 10, 14, 10]
+    data = pd.DataFrame(
+        {'close': np.array(closes, dtype=float)},
+        index=pd.date_range('2024-01-01', periods=len(closes))
+    )
+
+    strategy = BollingerBandsStrategy({'period': 4, 'std_dev': 1.0})
+    result = strategy.generate_signals(strategy.calculate_indicators(data))
+
+    assert result['signal'].tolist() == [0, 0, 0, 0, 0, 1, 0, 0, 0, -1, 0]
+
+
+def test_rolling_apply_matches_pandas():
+    """Test the custom-function rolling helper against pandas rolling"""
+    from strategies.indicators import rolling_apply
+
+    series = pd.Series(np.random.default_rng(0).normal(size=50))
+    result = rolling_apply(series, 5, np.max)
+
+    pd.testing.assert_series_equal(result, series.rolling(window=5).max())
+
+
+def test_cross_helpers_match_shift():
+    """Test crossover masks against the shift-based pandas expressions"""
+    from strategies.indicators import cross_above, cross_below
+
+    rng = np.random.default_rng(1)
+    a = pd.Series(rng.normal(size=100))
+    b = pd.Series(rng.normal(size=100))
+    a.iloc[[10, 40]] = np.nan
+
+    expected_above = (a > b) & (a.shift(1) <= b.shift(1))
+    expected_below = (a < 0.5) & (a.shift(1) >= 0.5)
+
+    np.testing.assert_array_equal(cross_above(a.to_numpy(), b.to_numpy()), expected_above.to_numpy())
+    np.testing.assert_array_equal(cross_below(a.to_numpy(), 0.5), expected_below.to_numpy())
+
+
+def test_wilder_rsi_recurrence():
+    """Test RSI kernel against Wilder's smoothing written out by hand"""
+    from strategies.indicators import wilder_rsi
+
+    close = pd.Series(100 + np.random.default_rng(2).normal(size=60).cumsum())
+    period = 14
+    delta = np.diff(close.to_numpy())
+    gains = np.clip(delta, 0, None)
+    losses = np.clip(-delta, 0, None)
+
+    avg_gain, avg_loss = gains[:period].mean(), losses[:period].mean()
+    expected = [100 - 100 / (1 + avg_gain / avg_loss)]
+    for gain, loss in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        expected.append(100 - 100 / (1 + avg_gain / avg_loss))
+
+    result = wilder_rsi(close, period)
+
+    assert result.iloc[:period].isna().all()
+    np.testing.assert_allclose(result.iloc[period:], expected)
+
+
+def test_wilder_rsi_skips_nan_prices():
+    """Test that a NaN close blanks its own changes instead of the whole RSI"""
+    from strategies.indicators import wilder_rsi
+
+    close = pd.Series(100 + np.random.default_rng(8).normal(size=200).cumsum())
+    clean = wilder_rsi(close, 14)
+
+    # NaN inside the seed window: the seed waits for 14 valid changes
+    seeded = close.copy()
+    seeded.iloc[5] = np.nan
+    result = wilder_rsi(seeded, 14)
+    assert result.iloc[:16].isna().all()
+    assert result.iloc[16:].notna().all()
+    assert (result.iloc[16:] < 100).any()
+
+    # NaN later on: only the two changes touching it are NaN
+    later = close.copy()
+    later.iloc[100] = np.nan
+    result = wilder_rsi(later, 14)
+    assert result.iloc[100:102].isna().all()
+    assert result.drop(result.index[100:102]).notna().sum() == clean.notna().sum() - 2
+    np.testing.assert_allclose(result.iloc[:100], clean.iloc[:100])
+
+
+def test_macd_lines_match_pandas_ewm():
+    """Test the MACD kernel against pandas ewm(adjust=False)"""
+    from strategies.indicators import macd_lines
+
+    close = pd.Series(100 + np.random.default_rng(4).normal(size=200).cumsum())
+    macd, macd_signal = macd_lines(close, 12, 26, 9)
+
+    expected = (
+        close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    )
+    np.testing.assert_allclose(macd, expected)
+    np.testing.assert_allclose(macd_signal, expected.ewm(span=9, adjust=False).mean())
+
+
+def test_macd_lines_skip_nan_like_pandas():
+    """Test that NaN prices do not poison the MACD kernel's EMAs"""
+    from strategies.indicators import macd_lines
+
+    close = pd.Series(100 + np.random.default_rng(6).normal(size=200).cumsum())
+    close.iloc[[0, 50, 51, 120]] = np.nan
+    macd, macd_signal = macd_lines(close, 12, 26, 9)
+
+    expected = (
+        close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    )
+    assert np.isnan(macd).sum() == 1
+    np.testing.assert_allclose(macd, expected)
+    np.testing.assert_allclose(macd_signal, expected.ewm(span=9, adjust=False).mean())
+
+
+def test_rolling_zscore_matches_rolling_helpers():
+    """Test the single-pass z-score kernel against rolling mean/std"""
+    from strategies.indicators import rolling_zscore
+
+    close = pd.Series(30000 + np.random.default_rng(5).normal(size=300).cumsum())
+    mean, std, z_score = rolling_zscore(close, 20)
+
+    expected_mean = close.rolling(window=20).mean()
+    expected_std = close.rolling(window=20).std()
+    np.testing.assert_allclose(mean, expected_mean, rtol=1e-9)
+    np.testing.assert_allclose(std, expected_std, rtol=1e-9)
+    np.testing.assert_allclose(z_score, (close - expected_mean) / expected_std, rtol=1e-6)
+
+    # Flat window: no z-score, like 0 / 0 in pandas
+    _, std, z_score = rolling_zscore(pd.Series([5.0, 5.0, 5.0, 6.0]), 3)
+    assert std[2] == 0 and np.isnan(z_score[2])
+
+
+def test_rolling_zscore_recovers_after_nan():
+    """Test that a NaN only blanks the windows that contain it, as in pandas"""
+    from strategies.indicators import rolling_zscore
+
+    close = pd.Series(30000 + np.random.default_rng(7).normal(size=300).cumsum())
+    close.iloc[100] = np.nan
+    mean, std, z_score = rolling_zscore(close, 20)
+
+    # Exact per-window std (pandas' online rolling std drifts by ~1e-9 here)
+    expected_mean = close.rolling(window=20).mean()
+    expected_std = close.rolling(window=20).apply(lambda w: w.std(ddof=1), raw=True)
+    assert np.isnan(z_score[100:120]).all()
+    assert not np.isnan(z_score[120:]).any()
+    np.testing.assert_allclose(mean, expected_mean, rtol=1e-9)
+    np.testing.assert_allclose(std, expected_std, rtol=1e-9)
+    np.testing.assert_allclose(z_score, (close - expected_mean) / expected_std, rtol=1e-6)
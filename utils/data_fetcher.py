@@ -2,6 +2,9 @@
 Data Fetcher - Gestión centralizada de datos de mercado desde PostgreSQL
 """
 import os
+import threading
+import time
+from collections import OrderedDict
 import pandas as pd
 import ccxt
 from datetime import datetime, timedelta
@@ -22,8 +25,20 @@ class DataFetcher:
     Binance API se usa solo para poblar la base de datos.
     """
     
+    # Cache de ventanas recientes para barridos de parámetros
+    CACHE_TTL_SECONDS = 300
+    CACHE_MAXSIZE = 64
+    
     def __init__(self):
         self.exchange = ccxt.binance({'enableRateLimit': True})
+        # (symbol, days, timeframe) -> (expira, versión de datos, DataFrame)
+        self._recent_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._data_version = 0
+    
+    def close(self) -> None:
+        """Cerrar la sesión HTTP del exchange (pool de conexiones keep-alive)"""
+        self.exchange.close()
         
     def fetch_from_db(
         self,
@@ -62,19 +77,16 @@ class DataFetcher:
                 print(f"⚠️  No hay datos en la base de datos para {symbol}")
                 return pd.DataFrame()
             
-            # Convertir a DataFrame
-            data = []
-            for record in records:
-                data.append({
-                    'timestamp': record.timestamp,
-                    'open': float(record.open),
-                    'high': float(record.high),
-                    'low': float(record.low),
-                    'close': float(record.close),
-                    'volume': float(record.volume)
-                })
-            
-            df = pd.DataFrame(data)
+            # Convertir a DataFrame (tuplas planas, sin un dict por registro)
+            ohlcv_cols = ['open', 'high', 'low', 'close', 'volume']
+            df = pd.DataFrame.from_records(
+                [
+                    (r.timestamp, r.open, r.high, r.low, r.close, r.volume)
+                    for r in records
+                ],
+                columns=['timestamp'] + ohlcv_cols
+            )
+            df = df.astype({col: float for col in ohlcv_cols})
             df['timestamp'] = pd.to_datetime(df['timestamp'])
             df = df.set_index('timestamp')
             
@@ -84,6 +96,54 @@ class DataFetcher:
         finally:
             db.close()
     
+    def fetch_recent(
+        self,
+        symbol: str,
+        days: int,
+        timeframe: str = '1d'
+    ) -> pd.DataFrame:
+        """
+        Obtener los últimos `days` días desde la DB, con cache en memoria
+        
+        Backtests repetidos sobre el mismo símbolo/período (barridos de
+        parámetros, comparación de estrategias) reutilizan el mismo DataFrame
+        durante CACHE_TTL_SECONDS o hasta que se ingresen datos nuevos.
+        
+        Args:
+            symbol: Símbolo del activo (formato ccxt: BTC/USDT)
+            days: Número de días hacia atrás desde ahora
+            timeframe: Temporalidad
+            
+        Returns:
+            DataFrame con datos OHLCV (copia superficial; no modificar valores)
+        """
+        key = (symbol, days, timeframe)
+        with self._cache_lock:
+            version = self._data_version
+            entry = self._recent_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic() and entry[1] == version:
+                self._recent_cache.move_to_end(key)
+                return entry[2].copy(deep=False)
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        df = self.fetch_from_db(symbol, start_date, end_date, timeframe)
+        
+        if not df.empty:
+            with self._cache_lock:
+                self._recent_cache[key] = (time.monotonic() + self.CACHE_TTL_SECONDS, version, df)
+                self._recent_cache.move_to_end(key)
+                while len(self._recent_cache) > self.CACHE_MAXSIZE:
+                    self._recent_cache.popitem(last=False)
+        
+        return df.copy(deep=False)
+    
+    def invalidate_cache(self) -> None:
+        """Descartar las ventanas cacheadas (llamar tras ingresar datos)"""
+        with self._cache_lock:
+            self._data_version += 1
+            self._recent_cache.clear()
+    
     def fetch_and_store_binance_data(
         self,
         symbol: str,
@@ -135,6 +195,7 @@ class DataFetcher:
             
             # Guardar en la base de datos
             count = crud.save_market_data_batch(db, data_list)
+            self.invalidate_cache()
             
             # Actualizar metadatos de la fuente
             source = crud.create_or_update_data_source(